@@ -1,18 +1,128 @@
 from __future__ import annotations
 
 import json
+import os
 import random
+import sys
+import threading
+import time
+import warnings
+import weakref
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from uuid import uuid4
+from typing import Any, Callable, Iterator
 
-from sqlmodel import Field, Session, SQLModel, create_engine, select
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+from sqlalchemy import Engine, Row, bindparam, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Index, Session, SQLModel, create_engine, func, insert, select, update
+
+
+# Leaderboard reads are served from memory for this long (and dropped on
+# every record_score); the entry cap bounds memory for many maze_ids/limits.
+_TOP_SCORES_TTL_SECONDS = 5.0
+_TOP_SCORES_CACHE_MAX = 32
+
+
+# Applied to every pooled DBAPI connection: WAL turns each commit into one
+# sequential log append, NORMAL sync drops the per-commit fsync, and the
+# cache/mmap sizes keep hot pages in memory. Auto-checkpoints are spaced out
+# (~40 MB of WAL) so a move rarely pays for one; close() truncates the log.
+_SQLITE_WAL_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA wal_autocheckpoint=10000",
+)
+# Reads are served straight from the mapped file (no read() copy per page).
+# 256 MiB, clamped to 64 MiB on 32-bit builds where address space is scarce.
+_SQLITE_MMAP_SIZE = 268435456 if sys.maxsize > 2**32 else 67108864
+_SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    f"PRAGMA mmap_size={_SQLITE_MMAP_SIZE}",
+    "PRAGMA cache_size=-65536",
+)
+
+# The repository's statements are module constants with bound parameters, so
+# their SQL text is stable; a 256-entry pysqlite statement cache holds them all.
+_SQLITE_CONNECT_ARGS: dict[str, Any] = {"check_same_thread": False, "cached_statements": 256}
+
+
+def _sqlite_pragma_listener(wal: bool) -> Callable[[Any, Any], None]:
+    """Build the engine "connect" hook; WAL is skipped for in-memory databases."""
+    pragmas = (_SQLITE_WAL_PRAGMAS if wal else ()) + _SQLITE_PRAGMAS
+
+    def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return _apply_sqlite_pragmas
+
+
+def _new_id() -> str:
+    # 128 random bits as 32 hex chars; skips building and dash-formatting a UUID.
+    return os.urandom(16).hex()
+
+
+# (epoch second, formatted) — every mutation within the same second reuses the string.
+_now_iso_cache: tuple[int, str] = (-1, "")
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    global _now_iso_cache
+    t = int(time.time())
+    if _now_iso_cache[0] != t:
+        _now_iso_cache = (t, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t)))
+    return _now_iso_cache[1]
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _dumps(value: dict[str, Any]) -> str:
+        """Serialize a JSON-safe dict for a TEXT column."""
+        return orjson.dumps(value).decode()
+
+else:
+    _json_loads = json.loads
+
+    def _dumps(value: dict[str, Any]) -> str:
+        """Serialize a JSON-safe dict for a TEXT column."""
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads(raw: Any) -> Any:
+    """Parse a stored JSON column; already-decoded values pass through."""
+    if isinstance(raw, (bytes, str)):
+        return _json_loads(raw)
+    return raw
+
+
+def _rank_value(metrics: dict[str, Any], key: str) -> float:
+    """Leaderboard sort key for one metric; missing values rank last."""
+    value = metrics.get(key)
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float("inf")
+
+
+def _rank_metrics(elapsed_seconds: float, moves: float) -> dict[str, Any]:
+    """Rebuild the ranked metrics from their stored columns (inverse of _rank_value)."""
+    metrics: dict[str, Any] = {}
+    for key, value in (("elapsed_seconds", elapsed_seconds), ("moves", moves)):
+        if value != float("inf"):
+            metrics[key] = int(value) if value.is_integer() else value
+    return metrics
 
 
 # ---------------------------------------------------------------------------
@@ -66,6 +176,8 @@ class QuestionRecord:
 
 class PlayerModel(SQLModel, table=True):
     __tablename__ = "players"
+    # get_or_create_player looks players up by handle.
+    __table_args__ = (Index("ix_players_handle", "handle"),)
     id: str = Field(primary_key=True)
     handle: str
     created_at: str
@@ -85,6 +197,12 @@ class GameModel(SQLModel, table=True):
 
 class ScoreModel(SQLModel, table=True):
     __tablename__ = "scores"
+    # Leaderboard indexes: SQLite walks these in ORDER BY order, so
+    # top_scores stops after `limit` rows instead of sorting the table.
+    __table_args__ = (
+        Index("ix_scores_maze_elapsed_moves", "maze_id", "elapsed_seconds", "moves"),
+        Index("ix_scores_elapsed_moves", "elapsed_seconds", "moves"),
+    )
     id: str = Field(primary_key=True)
     player_id: str
     game_id: str
@@ -92,10 +210,15 @@ class ScoreModel(SQLModel, table=True):
     maze_version: str
     metrics_json: str = Field(sa_column_kwargs={"name": "metrics"})
     created_at: str
+    # Leaderboard sort keys copied out of metrics at insert time.
+    elapsed_seconds: float = float("inf")
+    moves: float = float("inf")
 
 
 class QuestionModel(SQLModel, table=True):
     __tablename__ = "questions"
+    # Covers the unasked-question filter used by get_random_question.
+    __table_args__ = (Index("ix_questions_asked_category", "has_been_asked", "category"),)
     id: str = Field(primary_key=True)
     question_text: str
     correct_answer: str
@@ -103,6 +226,121 @@ class QuestionModel(SQLModel, table=True):
     has_been_asked: bool = False
 
 
+# Core table handles: hot-path reads/writes bypass the ORM unit of work.
+_PLAYERS = PlayerModel.__table__
+_GAMES = GameModel.__table__
+_SCORES = ScoreModel.__table__
+_QUESTIONS = QuestionModel.__table__
+
+# Hot-path statements, built once. Values travel as bind parameters, so each
+# call skips statement construction and hits the compiled-statement cache
+# (and sqlite3's prepared-statement cache) on the same SQL text.
+_GET_PLAYER = select(_PLAYERS).where(_PLAYERS.c.id == bindparam("player_id"))
+_FIND_PLAYER = (
+    select(_PLAYERS.c.id, _PLAYERS.c.handle, _PLAYERS.c.created_at)
+    .where(_PLAYERS.c.handle == bindparam("handle"))
+    .limit(1)
+)
+_INSERT_PLAYER = insert(_PLAYERS)
+_INSERT_GAME = insert(_GAMES)
+# Explicit column order: get_game unpacks rows positionally, which skips
+# SQLAlchemy Row's per-attribute name lookup.
+_GET_GAME = select(
+    _GAMES.c.id,
+    _GAMES.c.player_id,
+    _GAMES.c.maze_id,
+    _GAMES.c.maze_version,
+    _GAMES.c.state,
+    _GAMES.c.status,
+    _GAMES.c.created_at,
+    _GAMES.c.updated_at,
+).where(_GAMES.c.id == bindparam("game_id"))
+_GAME_IDENTITY = select(
+    _GAMES.c.id, _GAMES.c.player_id, _GAMES.c.maze_id, _GAMES.c.maze_version, _GAMES.c.created_at
+).where(_GAMES.c.id == bindparam("game_id"))
+_SAVE_GAME = update(_GAMES).where(_GAMES.c.id == bindparam("game_id"))
+_INSERT_SCORE = insert(_SCORES)
+_SCORE_COLUMNS: tuple[str, ...] = tuple(c.name for c in _SCORES.c)
+# Rows per multi-VALUES score INSERT, kept under the 999 bound-parameter limit
+# of SQLite builds before 3.32.
+_SCORE_ROWS_PER_INSERT = 999 // len(_SCORE_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def _insert_scores_sql(n_rows: int) -> str:
+    """``INSERT INTO scores ... VALUES (?, ...), ...`` for ``n_rows`` rows.
+
+    Plain driver SQL: at most _SCORE_ROWS_PER_INSERT distinct strings, each
+    compiled here once and then served from pysqlite's statement cache.
+    """
+    group = "(" + ", ".join("?" * len(_SCORE_COLUMNS)) + ")"
+    return (
+        f"INSERT INTO {_SCORES.name} ({', '.join(_SCORE_COLUMNS)}) VALUES "
+        + ", ".join([group] * n_rows)
+    )
+
+
+def _top_scores_select(columns: list[Any], by_maze: bool) -> Any:
+    stmt = select(*columns)
+    if by_maze:
+        stmt = stmt.where(_SCORES.c.maze_id == bindparam("maze_id"))
+    return stmt.order_by(_SCORES.c.elapsed_seconds, _SCORES.c.moves).limit(bindparam("limit"))
+
+
+# Indexed by [rank_only][filter on maze_id?]; LIMIT is bound, not inlined.
+# Rows are read by position in this column order; rank_only leaves the
+# trailing metrics JSON out of the SELECT.
+_TOP_SCORE_COLUMNS = [
+    _SCORES.c.id,
+    _SCORES.c.player_id,
+    _SCORES.c.game_id,
+    _SCORES.c.maze_id,
+    _SCORES.c.maze_version,
+    _SCORES.c.created_at,
+    _SCORES.c.elapsed_seconds,
+    _SCORES.c.moves,
+    _SCORES.c.metrics,
+]
+_TOP_SCORES = tuple(
+    tuple(_top_scores_select(columns, by_maze) for by_maze in (False, True))
+    for columns in (_TOP_SCORE_COLUMNS, _TOP_SCORE_COLUMNS[:-1])
+)
+_MARK_ASKED = (
+    update(_QUESTIONS).where(_QUESTIONS.c.id == bindparam("question_id")).values(has_been_asked=True)
+)
+_RESET_ASKED = update(_QUESTIONS).values(has_been_asked=False)
+_UPSERT_QUESTION = insert(_QUESTIONS).prefix_with("OR REPLACE")
+
+
+def _unasked_filter(by_category: bool) -> list[Any]:
+    where = [_QUESTIONS.c.has_been_asked == False]  # noqa: E712
+    if by_category:
+        where.append(_QUESTIONS.c.category == bindparam("category"))
+    return where
+
+
+# Indexed by "filter on category?" (False/True).
+_COUNT_UNASKED = tuple(
+    select(func.count()).select_from(_QUESTIONS).where(*_unasked_filter(by_category))
+    for by_category in (False, True)
+)
+_PICK_UNASKED = tuple(
+    select(
+        _QUESTIONS.c.id,
+        _QUESTIONS.c.question_text,
+        _QUESTIONS.c.correct_answer,
+        _QUESTIONS.c.category,
+    )
+    .where(*_unasked_filter(by_category))
+    .limit(1)
+    .offset(bindparam("offset"))
+    for by_category in (False, True)
+)
+_LIST_UNASKED_IDS = tuple(
+    select(_QUESTIONS.c.id).where(*_unasked_filter(by_category)) for by_category in (False, True)
+)
+
+
 # ---------------------------------------------------------------------------
 # Hacker-themed question bank seed data
 # ---------------------------------------------------------------------------
@@ -254,58 +492,245 @@ HACKER_SEED_QUESTIONS: list[dict[str, Any]] = [
 ]
 
 
+def _question_row(q: dict[str, Any]) -> dict[str, Any]:
+    """Insert parameters for one seed question (always unasked)."""
+    return {
+        "id": q["id"] if "id" in q else _new_id(),
+        "question_text": q["question_text"],
+        "correct_answer": q["correct_answer"],
+        "category": q.get("category", ""),
+        "has_been_asked": False,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Repository
 # ---------------------------------------------------------------------------
 
 
+def _release_engine(engine: Engine, pending_saves: dict[int, dict[str, dict[str, Any]]]) -> None:
+    """Finalizer for a repository dropped without close().
+
+    Deferred saves it still holds are committed (with a ResourceWarning)
+    rather than lost, then the pooled connections are released.
+    """
+    params = [save for saves in pending_saves.values() for save in saves.values()]
+    if params:
+        warnings.warn(
+            f"SqliteGameRepository dropped without close(); committing {len(params)} deferred save(s)",
+            ResourceWarning,
+        )
+        with engine.begin() as conn:
+            conn.execute(_SAVE_GAME, params)
+    engine.dispose()
+
+
 class SqliteGameRepository:
     """SQLite-backed repository using SQLModel. Sole persistence backend."""
 
     def __init__(self, path: str | Path):
         self.path = Path(path)
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        url = f"sqlite:///{self.path}"
-        self.engine = create_engine(url, connect_args={"check_same_thread": False})
+        in_memory = str(path) == ":memory:"
+        self._in_memory = in_memory
+        if in_memory:
+            # One shared connection, or every pooled connection would get its
+            # own empty database. Threads take turns on it (see _use); no
+            # rollback on return, which would undo another call's transaction.
+            self.engine = create_engine(
+                "sqlite://",
+                connect_args=_SQLITE_CONNECT_ARGS,
+                poolclass=StaticPool,
+                pool_reset_on_return=None,
+            )
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            url = f"sqlite:///{self.path}"
+            self.engine = create_engine(url, connect_args=_SQLITE_CONNECT_ARGS)
+        event.listen(self.engine, "connect", _sqlite_pragma_listener(wal=not in_memory))
+        # id(saves) -> game_id -> UPDATE parameters, one saves dict per thread
+        # that deferred writes with flush=False (see _thread_saves). A
+        # thread's dict stays here after the thread exits, for close().
+        self._pending_saves: dict[int, dict[str, dict[str, Any]]] = {}
+        # Commits leftover deferred saves and releases the pooled connections
+        # (and their .db/-wal/-shm handles) if the repository is dropped
+        # without close(); close() runs it early.
+        self._dispose = weakref.finalize(self, _release_engine, self.engine, self._pending_saves)
         SQLModel.metadata.create_all(self.engine)
+        self._migrate_score_columns()
         self._verify_schema()
+        self._ensure_indexes()
+        self._top_cache: dict[tuple[str | None, int | None, bool], tuple[float, list[Row]]] = {}
+        # Bumped after every committed score write; a read that raced one is
+        # not cached (see top_scores).
+        self._top_generation = 0
+        # One session per thread, released after every call (see _use);
+        # expire_on_commit=False keeps row attributes readable after commit.
+        self._session_factory = sessionmaker(self.engine, class_=Session, expire_on_commit=False)
+        self._local = threading.local()
+        # SQLite allows one writer at a time; serialize our own writers here
+        # instead of letting them collide on SQLITE_BUSY.
+        self._write_lock = threading.RLock()
+
+    @contextmanager
+    def _use(self) -> Iterator[Session]:
+        """This thread's session, released again when the call is done.
+
+        Outside transaction() the session is closed on exit, which ends its
+        transaction and hands the pooled connection back, so an idle thread
+        holds none; the closed session is reused by the thread's next call.
+        An in-memory repository has a single sqlite3 connection for all
+        threads, so there every call, reads included, holds the write lock.
+        """
+        with self._write_lock if self._in_memory else nullcontext():
+            session = getattr(self._local, "session", None)
+            if session is None:
+                session = self._local.session = self._session_factory()
+            try:
+                yield session
+            finally:
+                if not getattr(self._local, "tx_depth", 0):
+                    session.close()
+
+    def _commit(self, session: Session) -> None:
+        # Inside transaction() the outermost block commits instead.
+        if not getattr(self._local, "tx_depth", 0):
+            session.commit()
+
+    def _thread_saves(self, create: bool = False) -> dict[str, dict[str, Any]] | None:
+        """This thread's deferred saves; each thread reads and commits only its own.
+
+        Held in thread-local storage rather than keyed by thread ident, which
+        a new thread may reuse once the old one exits.
+        """
+        saves = getattr(self._local, "pending_saves", None)
+        if saves is None and create:
+            saves = self._local.pending_saves = {}
+            self._pending_saves[id(saves)] = saves
+        return saves
+
+    def _set_thread_saves(self, saves: dict[str, dict[str, Any]]) -> None:
+        # Caller holds _write_lock. An empty dict unregisters the thread.
+        current = self._thread_saves(create=bool(saves))
+        if current is None:
+            return
+        current.clear()
+        current.update(saves)
+        if not current:
+            del self._pending_saves[id(current)]
+            del self._local.pending_saves
+
+    def _invalidate_top_scores(self) -> None:
+        # Call once the score write is committed (or rolled back), never before.
+        self._top_generation += 1
+        self._top_cache.clear()
+
+    @contextmanager
+    def transaction(self) -> Iterator[SqliteGameRepository]:
+        """Group this thread's writes into one commit.
+
+        Writes inside the block skip their own commits; the outermost block
+        commits on success and rolls back if it raises, deferred saves made in
+        the block included. The write lock is held
+        throughout, and the outermost block opens with BEGIN IMMEDIATE so the
+        database write lock is taken up front. Blocks may nest.
+        """
+        with self._write_lock:
+            depth = getattr(self._local, "tx_depth", 0)
+            session = getattr(self._local, "session", None)
+            if session is None:
+                session = self._local.session = self._session_factory()
+            if not depth:
+                # tx_depth > 0 pins the session's connection for the whole block.
+                conn = session.connection()
+                # A deferred BEGIN upgrades to a write lock at the first write
+                # and, under WAL, fails with SQLITE_BUSY instead of waiting.
+                if not conn.connection.dbapi_connection.in_transaction:
+                    conn.exec_driver_sql("BEGIN IMMEDIATE")
+            if not depth:
+                # This thread's deferred saves are restored to this on rollback:
+                # ones queued in the block are dropped, ones flushed by it are
+                # queued again.
+                pending_before = dict(self._thread_saves() or {})
+            self._local.tx_depth = depth + 1
+            try:
+                yield self
+            except BaseException:
+                if not depth:
+                    session.rollback()
+                    self._set_thread_saves(pending_before)
+                    self._invalidate_top_scores()
+                raise
+            else:
+                if not depth:
+                    session.commit()
+                    # Scores written in the block are visible only from here on.
+                    self._invalidate_top_scores()
+            finally:
+                self._local.tx_depth = depth
+                if not depth:
+                    session.close()
+
+    def _migrate_score_columns(self) -> None:
+        """Add and backfill leaderboard columns on scores tables that predate them.
+
+        Values come from SQLite's JSON1 ``json_extract`` over the stored
+        metrics, so existing scores keep their rank instead of the table
+        failing schema verification and being recreated empty.
+        """
+        with self.engine.begin() as conn:
+            present = {row[1] for row in conn.execute(text("PRAGMA table_info(scores)"))}
+            # Nothing to backfill from; such tables fail _verify_schema and are rebuilt.
+            if "metrics" not in present:
+                return
+            for column in ("elapsed_seconds", "moves"):
+                if column in present:
+                    continue
+                conn.execute(text(f"ALTER TABLE scores ADD COLUMN {column} FLOAT"))
+                # Non-numeric or missing metrics rank last (9e999 is +inf in SQLite).
+                conn.execute(text(
+                    f"UPDATE scores SET {column} = CASE "
+                    f"WHEN json_type(metrics, '$.{column}') IN ('integer', 'real') "
+                    f"THEN json_extract(metrics, '$.{column}') ELSE 9e999 END"
+                ))
 
     def _verify_schema(self) -> None:
         """Drop and recreate tables if the existing schema is incompatible."""
-        try:
-            with Session(self.engine) as session:
-                session.exec(select(GameModel).limit(1)).all()
-                session.exec(select(ScoreModel).limit(1)).all()
-        except Exception:
+        with self.engine.connect() as conn:
+            compatible = all(
+                {c.name for c in table.columns}
+                <= {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")}
+                for table in (_GAMES, _SCORES)
+            )
+        if not compatible:
             SQLModel.metadata.drop_all(self.engine)
             SQLModel.metadata.create_all(self.engine)
 
+    def _ensure_indexes(self) -> None:
+        """Create indexes added after a table was first created."""
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
     # ------------------------------------------------------------------
     # Player ops
     # ------------------------------------------------------------------
 
     def get_player(self, player_id: str) -> dict[str, Any] | None:
-        with Session(self.engine) as session:
-            row = session.get(PlayerModel, player_id)
-            if row is None:
-                return None
-            return {"id": row.id, "handle": row.handle, "created_at": row.created_at}
+        with self._use() as session:
+            row = session.execute(_GET_PLAYER, {"player_id": player_id}).first()
+        if row is None:
+            return None
+        return {"id": row.id, "handle": row.handle, "created_at": row.created_at}
 
     def get_or_create_player(self, handle: str) -> dict[str, Any]:
-        with Session(self.engine) as session:
-            stmt = select(PlayerModel).where(PlayerModel.handle == handle)
-            row = session.exec(stmt).first()
+        with self._write_lock, self._use() as session:
+            row = session.execute(_FIND_PLAYER, {"handle": handle}).first()
             if row is not None:
                 return {"id": row.id, "handle": row.handle, "created_at": row.created_at}
-            created = PlayerModel(
-                id=str(uuid4()),
-                handle=handle,
-                created_at=_utc_now_iso(),
-            )
-            session.add(created)
-            session.commit()
-            session.refresh(created)
-            return {"id": created.id, "handle": created.handle, "created_at": created.created_at}
+            created = {"id": _new_id(), "handle": handle, "created_at": _utc_now_iso()}
+            session.execute(_INSERT_PLAYER, created)
+            self._commit(session)
+            return created
 
     # ------------------------------------------------------------------
     # Game ops
@@ -319,70 +744,130 @@ class SqliteGameRepository:
         initial_state: dict[str, Any],
     ) -> dict[str, Any]:
         now = _utc_now_iso()
-        game_id = str(uuid4())
-        with Session(self.engine) as session:
-            row = GameModel(
-                id=game_id,
-                player_id=player_id,
-                maze_id=maze_id,
-                maze_version=maze_version,
-                state_json=json.dumps(initial_state),
-                status="in_progress",
-                created_at=now,
-                updated_at=now,
+        game_id = _new_id()
+        with self._write_lock, self._use() as session:
+            session.execute(
+                _INSERT_GAME,
+                {
+                    "id": game_id,
+                    "player_id": player_id,
+                    "maze_id": maze_id,
+                    "maze_version": maze_version,
+                    "state": _dumps(initial_state),
+                    "status": "in_progress",
+                    "created_at": now,
+                    "updated_at": now,
+                },
             )
-            session.add(row)
-            session.commit()
+            self._commit(session)
+            return {
+                "id": game_id,
+                "player_id": player_id,
+                "maze_id": maze_id,
+                "maze_version": maze_version,
+                "state": initial_state,
+                "status": "in_progress",
+                "created_at": now,
+                "updated_at": now,
+            }
+
+    def get_game(self, game_id: str) -> dict[str, Any] | None:
+        with self._use() as session:
+            row = session.execute(_GET_GAME, {"game_id": game_id}).first()
+        if row is None:
+            return None
+        row_id, player_id, maze_id, maze_version, state_raw, status, created_at, updated_at = row
+        pending = (self._thread_saves() or {}).get(game_id)
+        if pending is not None:
+            # This thread's deferred save_game is newer than the committed row.
+            state_raw, status, updated_at = pending["state"], pending["status"], pending["updated_at"]
         return {
-            "id": game_id,
+            "id": row_id,
             "player_id": player_id,
             "maze_id": maze_id,
             "maze_version": maze_version,
-            "state": initial_state,
-            "status": "in_progress",
-            "created_at": now,
-            "updated_at": now,
+            "state": _loads(state_raw),
+            "status": status,
+            "created_at": created_at,
+            "updated_at": updated_at,
         }
 
-    def get_game(self, game_id: str) -> dict[str, Any] | None:
-        with Session(self.engine) as session:
-            row = session.get(GameModel, game_id)
+    def save_game(
+        self,
+        game_id: str,
+        state: dict[str, Any],
+        status: str = "in_progress",
+        flush: bool = True,
+    ) -> dict[str, Any]:
+        """Persist game state.
+
+        With ``flush=False`` the write is buffered (state serialized now) and
+        committed by this thread's next flushing ``save_game`` or ``flush()``,
+        or by ``close()`` (also after the thread has exited); this thread's
+        ``get_game`` already reflects it, other threads see the committed row.
+        Inside ``batch()`` every save is deferred this way.
+        """
+        now = _utc_now_iso()
+        with self._write_lock, self._use() as session:
+            row = session.execute(_GAME_IDENTITY, {"game_id": game_id}).first()
             if row is None:
-                return None
-            state = json.loads(row.state_json) if isinstance(row.state_json, str) else row.state_json
+                raise KeyError(f"Unknown game_id: {game_id}")
+            self._thread_saves(create=True)[game_id] = {
+                "game_id": game_id,
+                "state": _dumps(state),
+                "status": status,
+                "updated_at": now,
+            }
+            if flush and not getattr(self._local, "batch_depth", 0):
+                self._flush_pending(session, own=True)
             return {
                 "id": row.id,
                 "player_id": row.player_id,
                 "maze_id": row.maze_id,
                 "maze_version": row.maze_version,
                 "state": state,
-                "status": row.status,
+                "status": status,
                 "created_at": row.created_at,
-                "updated_at": row.updated_at,
+                "updated_at": now,
             }
 
-    def save_game(self, game_id: str, state: dict[str, Any], status: str = "in_progress") -> dict[str, Any]:
-        now = _utc_now_iso()
-        with Session(self.engine) as session:
-            row = session.get(GameModel, game_id)
-            if row is None:
-                raise KeyError(f"Unknown game_id: {game_id}")
-            row.state_json = json.dumps(state)
-            row.status = status
-            row.updated_at = now
-            session.add(row)
-            session.commit()
-            session.refresh(row)
-        return {
-            "id": row.id,
-            "player_id": row.player_id,
-            "maze_id": row.maze_id,
-            "maze_version": row.maze_version,
-            "state": state,
-            "status": status,
-            "created_at": row.created_at,
-            "updated_at": now,
-        }
+    def flush(self) -> None:
+        """Commit the save_game writes this thread deferred with ``flush=False``."""
+        with self._write_lock:
+            if self._thread_saves() is not None:
+                with self._use() as session:
+                    self._flush_pending(session, own=True)
+
+    @contextmanager
+    def batch(self) -> Iterator[SqliteGameRepository]:
+        """Defer this thread's save_game writes until the block exits.
+
+        Every save inside the block behaves as ``flush=False``; the outermost
+        block commits them all with one ``flush()``. Blocks may nest.
+        """
+        self._local.batch_depth = getattr(self._local, "batch_depth", 0) + 1
+        try:
+            yield self
+        finally:
+            self._local.batch_depth -= 1
+            if not self._local.batch_depth:
+                self.flush()
+
+    def _flush_pending(self, session: Session, own: bool) -> None:
+        # Caller holds _write_lock. One executemany + one commit for all games
+        # deferred by this thread (own) or by every thread (close()).
+        batches = [self._thread_saves() or {}] if own else list(self._pending_saves.values())
+        params = [save for saves in batches for save in saves.values()]
+        if params:
+            session.execute(_SAVE_GAME, params)
+            self._commit(session)
+        if own:
+            self._set_thread_saves({})
+        else:
+            # Other threads' dicts are emptied in place; they stay bound to
+            # those threads' locals.
+            for saves in batches:
+                saves.clear()
 
     # ------------------------------------------------------------------
     # Score ops
@@ -397,104 +882,210 @@ class SqliteGameRepository:
         metrics: dict[str, Any],
     ) -> dict[str, Any]:
         now = _utc_now_iso()
-        score_id = str(uuid4())
-        with Session(self.engine) as session:
-            row = ScoreModel(
-                id=score_id,
-                player_id=player_id,
-                game_id=game_id,
-                maze_id=maze_id,
-                maze_version=maze_version,
-                metrics_json=json.dumps(metrics),
-                created_at=now,
+        score_id = _new_id()
+        with self._write_lock, self._use() as session:
+            session.execute(
+                _INSERT_SCORE,
+                {
+                    "id": score_id,
+                    "player_id": player_id,
+                    "game_id": game_id,
+                    "maze_id": maze_id,
+                    "maze_version": maze_version,
+                    "metrics": _dumps(metrics),
+                    "created_at": now,
+                    "elapsed_seconds": _rank_value(metrics, "elapsed_seconds"),
+                    "moves": _rank_value(metrics, "moves"),
+                },
             )
-            session.add(row)
-            session.commit()
-        return {
-            "id": score_id,
-            "player_id": player_id,
-            "game_id": game_id,
-            "maze_id": maze_id,
-            "maze_version": maze_version,
-            "metrics": metrics,
-            "created_at": now,
-        }
+            self._commit(session)
+            if not getattr(self._local, "tx_depth", 0):
+                self._invalidate_top_scores()
+            return {
+                "id": score_id,
+                "player_id": player_id,
+                "game_id": game_id,
+                "maze_id": maze_id,
+                "maze_version": maze_version,
+                "metrics": metrics,
+                "created_at": now,
+            }
 
-    def top_scores(self, maze_id: str | None = None, limit: int = 10) -> list[dict[str, Any]]:
-        with Session(self.engine) as session:
-            stmt = select(ScoreModel)
-            if maze_id is not None:
-                stmt = stmt.where(ScoreModel.maze_id == maze_id)
-            rows = session.exec(stmt).all()
-        items = []
-        for row in rows:
-            metrics = json.loads(row.metrics_json) if isinstance(row.metrics_json, str) else row.metrics_json
-            items.append({
-                "id": row.id,
-                "player_id": row.player_id,
-                "game_id": row.game_id,
-                "maze_id": row.maze_id,
-                "maze_version": row.maze_version,
+    def record_scores_bulk(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Insert many score records in one executemany and one commit.
+
+        Each item carries the same keys as ``record_score``'s arguments.
+        """
+        if not items:
+            return []
+        now = _utc_now_iso()
+        records: list[dict[str, Any]] = []
+        rows: list[dict[str, Any]] = []
+        for item in items:
+            metrics = item["metrics"]
+            record = {
+                "id": _new_id(),
+                "player_id": item["player_id"],
+                "game_id": item["game_id"],
+                "maze_id": item["maze_id"],
+                "maze_version": item["maze_version"],
                 "metrics": metrics,
-                "created_at": row.created_at,
-            })
-        items.sort(key=lambda s: (
-            s["metrics"].get("elapsed_seconds", float("inf")),
-            s["metrics"].get("moves", float("inf")),
-        ))
-        return items[:limit]
+                "created_at": now,
+            }
+            records.append(record)
+            rows.append(
+                {
+                    **record,
+                    "metrics": _dumps(metrics),
+                    "elapsed_seconds": _rank_value(metrics, "elapsed_seconds"),
+                    "moves": _rank_value(metrics, "moves"),
+                }
+            )
+        with self._write_lock, self._use() as session:
+            if len(rows) == 1:
+                session.execute(_INSERT_SCORE, rows[0])
+            else:
+                # One multi-row VALUES statement per chunk: SQLite runs one
+                # prepared program per chunk instead of one per row.
+                conn = session.connection()
+                step = _SCORE_ROWS_PER_INSERT
+                for start in range(0, len(rows), step):
+                    chunk = rows[start : start + step]
+                    conn.exec_driver_sql(
+                        _insert_scores_sql(len(chunk)),
+                        tuple(row[c] for row in chunk for c in _SCORE_COLUMNS),
+                    )
+            self._commit(session)
+            if not getattr(self._local, "tx_depth", 0):
+                self._invalidate_top_scores()
+            return records
+
+    def top_scores(
+        self, maze_id: str | None = None, limit: int | None = 10, rank_only: bool = False
+    ) -> list[dict[str, Any]]:
+        """Best scores first, by elapsed_seconds then moves.
+
+        ``limit=None`` returns every score (e.g. a leaderboard export), still
+        read in index order rather than sorted. With ``rank_only`` each
+        ``metrics`` holds just elapsed_seconds and moves, rebuilt from their
+        columns; the stored JSON is not read.
+        """
+        key = (maze_id, limit, rank_only)
+        # Inside transaction() this thread sees its uncommitted scores: bypass
+        # the shared cache both ways.
+        use_cache = not getattr(self._local, "tx_depth", 0)
+        generation = self._top_generation
+        cached = self._top_cache.get(key) if use_cache else None
+        if cached is not None and time.monotonic() - cached[0] < _TOP_SCORES_TTL_SECONDS:
+            rows = cached[1]
+        else:
+            with self._use() as session:
+                rows = session.execute(
+                    _TOP_SCORES[rank_only][maze_id is not None],
+                    # LIMIT -1 is SQLite for "no limit".
+                    {"maze_id": maze_id, "limit": -1 if limit is None else limit},
+                ).all()
+            # A commit landing during the read may have been missed; skip caching.
+            if use_cache and generation == self._top_generation:
+                if len(self._top_cache) >= _TOP_SCORES_CACHE_MAX:
+                    self._top_cache.clear()
+                self._top_cache[key] = (time.monotonic(), rows)
+        # The cache holds immutable rows; every call builds its own dicts, so
+        # callers may mutate the result. Only the top-K rows pay for parsing.
+        return [
+            {
+                "id": row[0],
+                "player_id": row[1],
+                "game_id": row[2],
+                "maze_id": row[3],
+                "maze_version": row[4],
+                "metrics": _rank_metrics(row[6], row[7]) if rank_only else _loads(row[8]),
+                "created_at": row[5],
+            }
+            for row in rows
+        ]
 
     # ------------------------------------------------------------------
     # Question bank ops
     # ------------------------------------------------------------------
 
     def get_random_question(self, category: str | None = None) -> dict[str, Any] | None:
-        with Session(self.engine) as session:
-            stmt = select(QuestionModel).where(QuestionModel.has_been_asked == False)  # noqa: E712
-            if category is not None:
-                stmt = stmt.where(QuestionModel.category == category)
-            rows = list(session.exec(stmt).all())
-        if not rows:
-            return None
-        row = random.choice(rows)
-        return {
-            "id": row.id,
-            "question_text": row.question_text,
-            "correct_answer": row.correct_answer,
-            "category": row.category,
-        }
+        by_category = category is not None
+        params = {"category": category} if by_category else {}
+        with self._use() as session:
+            # The count is not cached: other repositories or processes may
+            # mark or reset questions at any time.
+            while True:
+                count = session.execute(_COUNT_UNASKED[by_category], params).scalar_one()
+                if count == 0:
+                    return None
+                # Random OFFSET over the indexed filter: one row leaves SQLite,
+                # and there is no ORDER BY RANDOM() full sort.
+                row = session.execute(
+                    _PICK_UNASKED[by_category], {**params, "offset": random.randrange(count)}
+                ).first()
+                if row is not None:
+                    break
+                # A writer removed rows between COUNT and pick; recount.
+            return {
+                "id": row.id,
+                "question_text": row.question_text,
+                "correct_answer": row.correct_answer,
+                "category": row.category,
+            }
+
+    def list_available_question_ids(self, category: str | None = None) -> list[str]:
+        """Ids of every unasked question (optionally in one category), in one query."""
+        by_category = category is not None
+        params = {"category": category} if by_category else {}
+        with self._use() as session:
+            return list(session.execute(_LIST_UNASKED_IDS[by_category], params).scalars())
 
     def mark_question_asked(self, question_id: str) -> None:
-        with Session(self.engine) as session:
-            row = session.get(QuestionModel, question_id)
-            if row is not None:
-                row.has_been_asked = True
-                session.add(row)
-                session.commit()
+        with self._write_lock, self._use() as session:
+            session.execute(_MARK_ASKED, {"question_id": question_id})
+            self._commit(session)
 
     def seed_questions(self, questions: list[dict[str, Any]]) -> None:
-        with Session(self.engine) as session:
-            for q in questions:
-                row = QuestionModel(
-                    id=q.get("id", str(uuid4())),
-                    question_text=q["question_text"],
-                    correct_answer=q["correct_answer"],
-                    category=q.get("category", ""),
-                    has_been_asked=False,
-                )
-                session.merge(row)
-            session.commit()
+        if not questions:
+            return
+        rows = [_question_row(q) for q in questions]
+        with self._write_lock, self._use() as session:
+            # One INSERT OR REPLACE executemany instead of a SELECT+UPSERT per row.
+            session.execute(_UPSERT_QUESTION, rows)
+            self._commit(session)
 
     def reset_questions(self) -> None:
-        with Session(self.engine) as session:
-            rows = session.exec(select(QuestionModel)).all()
-            for row in rows:
-                row.has_been_asked = False
-                session.add(row)
-            session.commit()
+        with self._write_lock, self._use() as session:
+            session.execute(_RESET_ASKED)
+            self._commit(session)
+
+    def compact(self) -> None:
+        """Rebuild the database file with VACUUM, leaving no free pages.
+
+        A maintenance call (e.g. a nightly job), not a request-path one: it
+        rewrites the whole file while holding the write lock. This thread's
+        deferred saves are flushed first. Not allowed inside transaction().
+        """
+        with self._write_lock:
+            if getattr(self._local, "tx_depth", 0):
+                raise RuntimeError("compact() cannot run inside transaction()")
+            self.flush()
+            with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("VACUUM")
 
     def close(self) -> None:
-        self.engine.dispose()
+        with self._write_lock:
+            if not self._dispose.alive:
+                return  # already closed
+            # Every thread's deferred saves, not just the caller's.
+            if self._pending_saves:
+                with self._use() as session:
+                    self._flush_pending(session, own=False)
+            if not self._in_memory:
+                with self.engine.connect() as conn:
+                    conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._dispose()
 
 
 # ---------------------------------------------------------------------------
@@ -504,6 +1095,7 @@ class SqliteGameRepository:
 
 def open_repo(path: str | Path) -> SqliteGameRepository:
     """Return a SqliteGameRepository connected to the given path.
-    Creates the database and tables if they do not exist.
+    Creates the database and tables if they do not exist; ``":memory:"``
+    opens a private in-memory database.
     """
-    return SqliteGameRepository(Path(path))
+    return SqliteGameRepository(path)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import bisect
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -7,6 +10,16 @@ from typing import Any
 from maze import Direction, Position
 
 
+# Upper-cased command token -> Direction ("N" and "NORTH" both map to N).
+_TOKEN_TO_DIR: dict[str, Direction] = {
+    **{d.name: d for d in Direction},
+    "NORTH": Direction.N,
+    "SOUTH": Direction.S,
+    "EAST": Direction.E,
+    "WEST": Direction.W,
+}
+
+
 @dataclass(frozen=True)
 class Command:
     """
@@ -60,6 +73,8 @@ class GameEngine:
         self.player_id = player_id
         self.game_id = game_id
         self._score_recorded = False
+        # Sorted move tokens per position; the maze never changes under us.
+        self._move_tokens: dict[Position, list[str]] = {}
         self._load_state()
 
     def _load_state(self) -> None:
@@ -72,7 +87,11 @@ class GameEngine:
         pos = game_state.get("pos", {"row": self.maze.start.row, "col": self.maze.start.col})
         self._pos = Position(row=pos["row"], col=pos["col"])
         self._move_count = int(game_state.get("move_count", 0))
-        self._solved_gates = set(game_state.get("solved_gates", []))
+        # Interned so membership tests against the maze's (interned) gate ids
+        # hit on identity before comparing characters.
+        self._solved_gates = {sys.intern(g) for g in game_state.get("solved_gates", [])}
+        # Kept sorted alongside the set so saving never re-sorts.
+        self._solved_gates_sorted = sorted(self._solved_gates)
         self._started_at = game_state.get("started_at")
         self._pending_gate_id: str | None = None
         self._pending_db_question: dict[str, str] | None = None
@@ -89,7 +108,7 @@ class GameEngine:
         return {
             "pos": {"row": self._pos.row, "col": self._pos.col},
             "move_count": self._move_count,
-            "solved_gates": sorted(self._solved_gates),
+            "solved_gates": list(self._solved_gates_sorted),
             "started_at": self._started_at,
             "ended_at": _utc_now_iso() if self._is_complete else None,
             "visited": [{"row": p.row, "col": p.col} for p in sorted(self._visited, key=lambda p: (p.row, p.col))],
@@ -101,16 +120,7 @@ class GameEngine:
     def _direction_from_token(self, token: str | None) -> Direction | None:
         if token is None:
             return None
-        t = token.strip().upper()
-        if t == "NORTH":
-            t = "N"
-        elif t == "SOUTH":
-            t = "S"
-        elif t == "EAST":
-            t = "E"
-        elif t == "WEST":
-            t = "W"
-        return Direction.__members__.get(t)
+        return _TOKEN_TO_DIR.get(token.strip().upper())
 
     def _pending_puzzle_payload(self) -> dict[str, str] | None:
         if self._pending_gate_id is None:
@@ -126,7 +136,11 @@ class GameEngine:
         return {"puzzle_id": puzzle.id, "title": puzzle.title, "prompt": puzzle.prompt}
 
     def _available_move_tokens(self) -> list[str]:
-        return sorted(d.name for d in self.maze.available_moves(self._pos))
+        tokens = self._move_tokens.get(self._pos)
+        if tokens is None:
+            tokens = sorted(d.name for d in self.maze.available_moves(self._pos))
+            self._move_tokens[self._pos] = tokens
+        return list(tokens)
 
     def _maybe_finish(self) -> bool:
         if self._pos != self.maze.exit:
@@ -189,7 +203,9 @@ class GameEngine:
                 puzzle = self.puzzles.get(self._pending_gate_id)
                 correct = puzzle.check(answer, self._serialize_state())
             if correct:
-                self._solved_gates.add(self._pending_gate_id)
+                if self._pending_gate_id not in self._solved_gates:
+                    self._solved_gates.add(self._pending_gate_id)
+                    bisect.insort(self._solved_gates_sorted, self._pending_gate_id)
                 if self._pending_db_question is not None and hasattr(self.repo, "mark_question_asked"):
                     self.repo.mark_question_asked(self._pending_db_question["id"])
                 self._pending_gate_id = None
@@ -238,7 +254,7 @@ class GameEngine:
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _elapsed_seconds(started_at: str | None) -> int:
@@ -448,7 +464,8 @@ def cli_main() -> None:
             continue
 
         if verb == "scores":
-            scores = repo.top_scores(maze_id=maze.maze_id, limit=5)
+            # Only moves and elapsed_seconds are shown.
+            scores = repo.top_scores(maze_id=maze.maze_id, limit=5, rank_only=True)
             if not scores:
                 print("  No scores recorded yet.")
             else:
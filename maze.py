@@ -1,32 +1,81 @@
 from __future__ import annotations
 
 import random
+import struct
+import sys
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict
-
-
-class Direction(Enum):
-    N = (-1, 0)
-    S = (1, 0)
-    E = (0, 1)
-    W = (0, -1)
-
-    @property
-    def delta(self) -> tuple[int, int]:
-        return self.value
-
-    @property
-    def opposite(self) -> "Direction":
-        return {
-            Direction.N: Direction.S,
-            Direction.S: Direction.N,
-            Direction.E: Direction.W,
-            Direction.W: Direction.E,
-        }[self]
-
-
-@dataclass(frozen=True)
+from enum import Enum, IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+
+class Direction(IntEnum):
+    # Values double as wall/opening bits, so masks test `mask & direction`
+    # and members hash as plain ints in sets and dict keys.
+    N = 1
+    S = 2
+    E = 4
+    W = 8
+
+    # Bound per member below as plain attributes: a direct instance-dict read
+    # instead of a property call on every move/pathfinding step.
+    delta: tuple[int, int]
+    opposite: "Direction"
+
+    # Render as "Direction.N" like a plain Enum, not as the bare int.
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
+
+
+_OPPOSITE: Dict[Direction, Direction] = {
+    Direction.N: Direction.S,
+    Direction.S: Direction.N,
+    Direction.E: Direction.W,
+    Direction.W: Direction.E,
+}
+_DELTA: Dict[Direction, tuple[int, int]] = {
+    Direction.N: (-1, 0),
+    Direction.S: (1, 0),
+    Direction.E: (0, 1),
+    Direction.W: (0, -1),
+}
+for _d in Direction:
+    _d.delta = _DELTA[_d]
+    _d.opposite = _OPPOSITE[_d]
+del _d
+# Fixed N, S, E, W order (same as Enum iteration, so seeded generation is
+# unchanged) without running EnumMeta.__iter__ in hot loops.
+_DIRECTIONS: tuple[Direction, ...] = (Direction.N, Direction.S, Direction.E, Direction.W)
+
+# One bit per direction (N=1, S=2, E=4, W=8). Builders keep walls as these
+# masks and Maze keeps each cell's open directions as one byte.
+_BIT: Dict[Direction, int] = {d: int(d) for d in _DIRECTIONS}
+_DIR_BY_BIT: Dict[int, Direction] = {bit: d for d, bit in _BIT.items()}
+_ALL_WALLS = 0x0F
+
+
+def _mask_of(directions: frozenset[Direction] | set[Direction]) -> int:
+    mask = 0
+    for d in directions:
+        mask |= _BIT[d]
+    return mask
+
+
+# Set bits of every 4-bit mask in N, S, E, W order, and each bit's opposite.
+_MASK_BITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(_BIT[d] for d in _DIRECTIONS if mask & _BIT[d]) for mask in range(16)
+)
+_OPPOSITE_BIT: Dict[int, int] = {_BIT[d]: _BIT[d.opposite] for d in _DIRECTIONS}
+
+# Decoded direction set for every 4-bit mask; cells with the same walls or
+# openings share one frozenset.
+_MASK_TO_MOVES: tuple[frozenset[Direction], ...] = tuple(
+    frozenset(d for d in _DIRECTIONS if mask & _BIT[d]) for mask in range(16)
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Position:
     row: int
     col: int
@@ -38,7 +87,7 @@ class CellKind(Enum):
     NORMAL = "normal"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellSpec:
     pos: Position
     kind: CellKind
@@ -46,7 +95,12 @@ class CellSpec:
     description: str
     blocked: frozenset[Direction] = field(default_factory=frozenset)
     puzzle_id: str | None = None
-    edge_gates: Dict[Direction, str] = field(default_factory=dict)
+    edge_gates: Mapping[Direction, str] = field(default_factory=dict)
+    # `blocked` as a 4-bit mask (N=1, S=2, E=4, W=8), derived once.
+    blocked_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "blocked_mask", _mask_of(self.blocked))
 
 
 @dataclass(frozen=True)
@@ -57,122 +111,226 @@ class Maze:
     height: int
     start: Position
     exit: Position
-    cells: Dict[Position, CellSpec]
+    cells: Mapping[Position, CellSpec]
+    # Dense row-major copies of `cells` and of each cell's open-direction
+    # bitmask, indexed by row * width + col: integer math instead of hashing
+    # Position, and one byte per cell instead of a set.
+    _cells_flat: list[CellSpec | None] = field(init=False, repr=False, compare=False)
+    _open: bytearray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        width, height = self.width, self.height
+        flat = [self.cells.get(Position(r, c)) for r in range(height) for c in range(width)]
+        walls = [_ALL_WALLS if spec is None else spec.blocked_mask for spec in flat]
+        is_open = bytearray(width * height)
+        for idx, spec in enumerate(flat):
+            if spec is None:
+                continue
+            r, c = divmod(idx, width)
+            mask = 0
+            for d in _DIRECTIONS:
+                bit = _BIT[d]
+                if walls[idx] & bit:
+                    continue
+                dr, dc = d.delta
+                nr, nc = r + dr, c + dc
+                if not (0 <= nr < height and 0 <= nc < width):
+                    continue
+                nidx = nr * width + nc
+                if flat[nidx] is None or walls[nidx] & _BIT[d.opposite]:
+                    continue
+                mask |= bit
+            is_open[idx] = mask
+        object.__setattr__(self, "_cells_flat", flat)
+        object.__setattr__(self, "_open", is_open)
 
     def in_bounds(self, pos: Position) -> bool:
         return 0 <= pos.row < self.height and 0 <= pos.col < self.width
 
     def cell(self, pos: Position) -> CellSpec:
-        if not self.in_bounds(pos):
+        if not (0 <= pos.row < self.height and 0 <= pos.col < self.width):
             raise ValueError(f"Out of bounds position: {pos}")
-        return self.cells[pos]
+        return self._cell_at(pos)
+
+    def _cell_at(self, pos: Position) -> CellSpec:
+        # Caller has already bounds-checked pos.
+        spec = self._cells_flat[pos.row * self.width + pos.col]
+        if spec is None:
+            raise KeyError(pos)
+        return spec
 
     def available_moves(self, pos: Position) -> set[Direction]:
-        if not self.in_bounds(pos):
+        r, c = pos.row, pos.col
+        if not (0 <= r < self.height and 0 <= c < self.width):
             return set()
-
-        here = self.cell(pos)
-        moves: set[Direction] = set()
-        for direction in Direction:
-            if direction in here.blocked:
-                continue
-            nxt = self.next_pos(pos, direction)
-            if nxt is None:
-                continue
-            nxt_cell = self.cell(nxt)
-            if direction.opposite in nxt_cell.blocked:
-                continue
-            moves.add(direction)
-        return moves
+        # Fresh set per call: the contract is a mutable set.
+        return set(_MASK_TO_MOVES[self._open[r * self.width + c]])
 
     def next_pos(self, pos: Position, direction: Direction) -> Position | None:
-        if not self.in_bounds(pos):
-            return None
-        here = self.cell(pos)
-        if direction in here.blocked:
+        r, c = pos.row, pos.col
+        if not (0 <= r < self.height and 0 <= c < self.width) or not self._open[r * self.width + c] & direction:
             return None
         dr, dc = direction.delta
-        nxt = Position(row=pos.row + dr, col=pos.col + dc)
-        if not self.in_bounds(nxt):
-            return None
-        nxt_cell = self.cell(nxt)
-        if direction.opposite in nxt_cell.blocked:
-            return None
-        return nxt
+        return Position(row=r + dr, col=c + dc)
 
     def puzzle_id_at(self, pos: Position) -> str | None:
-        if not self.in_bounds(pos):
+        if not (0 <= pos.row < self.height and 0 <= pos.col < self.width):
             return None
-        return self.cell(pos).puzzle_id
+        return self._cell_at(pos).puzzle_id
 
     def gate_id_for(self, pos: Position, direction: Direction) -> str | None:
-        if not self.in_bounds(pos):
+        if not (0 <= pos.row < self.height and 0 <= pos.col < self.width):
             return None
-        return self.cell(pos).edge_gates.get(direction)
+        return self._cell_at(pos).edge_gates.get(direction)
+
+    def pack(self) -> "PackedMaze":
+        """Snapshot walls, kinds, puzzles and gates into one contiguous blob."""
+        strings: list[str] = [""]
+        index: dict[str, int] = {}
+
+        def intern(value: str | None) -> int:
+            if value is None:
+                return 0
+            if value not in index:
+                index[value] = len(strings)
+                strings.append(value)
+            return index[value]
+
+        data = bytearray(_PACKED_RECORD.size * self.width * self.height)
+        for idx, spec in enumerate(self._cells_flat):
+            if spec is None:
+                continue
+            _PACKED_RECORD.pack_into(
+                data,
+                idx * _PACKED_RECORD.size,
+                spec.blocked_mask,
+                _KIND_CODE[spec.kind],
+                intern(spec.puzzle_id),
+                *(intern(spec.edge_gates.get(d)) for d in _DIRECTIONS),
+            )
+        return PackedMaze(width=self.width, height=self.height, data=bytes(data), strings=tuple(strings))
 
 
-def _make_grid(width: int, height: int) -> Dict[Position, dict]:
-    data: Dict[Position, dict] = {}
-    for r in range(height):
-        for c in range(width):
-            pos = Position(row=r, col=c)
-            data[pos] = {
-                "kind": CellKind.NORMAL,
-                "title": f"Node {r},{c}",
-                "description": "Neon-lit system corridor.",
-                "blocked": set(),
-                "puzzle_id": None,
-                "edge_gates": {},
-            }
-    return data
-
-
-def _add_wall(grid: Dict[Position, dict], pos: Position, direction: Direction) -> None:
-    grid[pos]["blocked"].add(direction)
+# One 16-byte little-endian record per cell: blocked mask (u8), kind (u8),
+# puzzle string index (u16), N/S/E/W gate string indices (4 x u16), padding.
+# String index 0 means "none".
+_PACKED_RECORD = struct.Struct("<BBH4H4x")
+_KINDS: tuple[CellKind, ...] = tuple(CellKind)
+_KIND_CODE: Dict[CellKind, int] = {kind: i for i, kind in enumerate(_KINDS)}
+
+
+@dataclass(frozen=True)
+class PackedMaze:
+    """Read-only, row-major packed view of a Maze for full-grid scans."""
+
+    width: int
+    height: int
+    data: bytes
+    strings: tuple[str, ...]
+
+    def _offset(self, row: int, col: int) -> int:
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise ValueError(f"Out of bounds position: {row},{col}")
+        return (row * self.width + col) * _PACKED_RECORD.size
+
+    def _string(self, i: int) -> str | None:
+        return self.strings[i] if i else None
+
+    def blocked_mask(self, row: int, col: int) -> int:
+        return self.data[self._offset(row, col)]
+
+    def kind(self, row: int, col: int) -> CellKind:
+        return _KINDS[self.data[self._offset(row, col) + 1]]
+
+    def puzzle_id(self, row: int, col: int) -> str | None:
+        return self._string(_PACKED_RECORD.unpack_from(self.data, self._offset(row, col))[2])
+
+    def gate_id(self, row: int, col: int, direction: Direction) -> str | None:
+        record = _PACKED_RECORD.unpack_from(self.data, self._offset(row, col))
+        return self._string(record[3 + _DIRECTIONS.index(direction)])
+
+
+def _make_grid(width: int, height: int) -> list[dict]:
+    """Per-cell build data in row-major order, keyed by index r * width + c."""
+    return [
+        {
+            "kind": CellKind.NORMAL,
+            "title": f"Node {r},{c}",
+            "description": "Neon-lit system corridor.",
+            "blocked": 0,
+            "puzzle_id": None,
+            "edge_gates": {},
+        }
+        for r in range(height)
+        for c in range(width)
+    ]
+
+
+def _add_wall(grid: list[dict], width: int, height: int, pos: Position, direction: Direction) -> None:
+    grid[pos.row * width + pos.col]["blocked"] |= _BIT[direction]
     dr, dc = direction.delta
-    other = Position(row=pos.row + dr, col=pos.col + dc)
-    if other in grid:
-        grid[other]["blocked"].add(direction.opposite)
+    nr, nc = pos.row + dr, pos.col + dc
+    if 0 <= nr < height and 0 <= nc < width:
+        grid[nr * width + nc]["blocked"] |= _BIT[direction.opposite]
+
 
+def _freeze_cells(grid: list[dict], width: int) -> Mapping[Position, CellSpec]:
+    """Materialize build data as the public, read-only Position -> CellSpec mapping.
 
+    The grid is discarded by the caller, so its edge_gates dicts are handed
+    over rather than copied. Both mappings are wrapped read-only: builders
+    cache and share the Maze, and Maze derives _cells_flat/_open from them once.
+    """
+    positions = [Position(*divmod(idx, width)) for idx in range(len(grid))]
+    return MappingProxyType({
+        pos: CellSpec(
+            pos=pos,
+            kind=item["kind"],
+            title=item["title"],
+            description=item["description"],
+            blocked=_MASK_TO_MOVES[item["blocked"]],
+            puzzle_id=item["puzzle_id"],
+            edge_gates=MappingProxyType(item["edge_gates"]),
+        )
+        for pos, item in zip(positions, grid)
+    })
+
+
+# Builders are pure functions of their arguments and Maze is read-only, so
+# repeat calls share one instance.
+@lru_cache(maxsize=1)
 def build_minimal_3x3_maze() -> Maze:
     width, height = 3, 3
     start = Position(0, 0)
     exit_pos = Position(2, 2)
 
     grid = _make_grid(width=width, height=height)
+    start_cell = grid[start.row * width + start.col]
+    exit_cell = grid[exit_pos.row * width + exit_pos.col]
 
-    grid[start]["kind"] = CellKind.START
-    grid[start]["title"] = "Ingress Port"
-    grid[start]["description"] = "You jack into the internal network."
+    start_cell["kind"] = CellKind.START
+    start_cell["title"] = "Ingress Port"
+    start_cell["description"] = "You jack into the internal network."
 
-    grid[exit_pos]["kind"] = CellKind.EXIT
-    grid[exit_pos]["title"] = "Root Access Gateway"
-    grid[exit_pos]["description"] = "One final jump grants root shell."
+    exit_cell["kind"] = CellKind.EXIT
+    exit_cell["title"] = "Root Access Gateway"
+    exit_cell["description"] = "One final jump grants root shell."
 
     # A small fixed maze shape.
-    _add_wall(grid, Position(0, 1), Direction.S)
-    _add_wall(grid, Position(1, 0), Direction.S)
-    _add_wall(grid, Position(1, 1), Direction.E)
+    _add_wall(grid, width, height, Position(0, 1), Direction.S)
+    _add_wall(grid, width, height, Position(1, 0), Direction.S)
+    _add_wall(grid, width, height, Position(1, 1), Direction.E)
 
     # Gate one edge and place a corresponding puzzle in the adjacent cell.
     gate_id = "gate-python-basics-1"
-    grid[start]["edge_gates"][Direction.E] = gate_id
-    grid[Position(0, 1)]["puzzle_id"] = gate_id
-    grid[Position(0, 1)]["title"] = "Firewall Lattice"
-    grid[Position(0, 1)]["description"] = "A Python challenge guards this route."
-
-    cells: Dict[Position, CellSpec] = {}
-    for pos, item in grid.items():
-        cells[pos] = CellSpec(
-            pos=pos,
-            kind=item["kind"],
-            title=item["title"],
-            description=item["description"],
-            blocked=frozenset(item["blocked"]),
-            puzzle_id=item["puzzle_id"],
-            edge_gates=dict(item["edge_gates"]),
-        )
+    start_cell["edge_gates"][Direction.E] = gate_id
+    gated_pos = Position(0, 1)
+    gated = grid[gated_pos.row * width + gated_pos.col]
+    gated["puzzle_id"] = gate_id
+    gated["title"] = "Firewall Lattice"
+    gated["description"] = "A Python challenge guards this route."
+
+    cells = _freeze_cells(grid, width)
 
     return Maze(
         maze_id="maze-3x3-v1",
@@ -188,96 +346,114 @@ def build_minimal_3x3_maze() -> Maze:
 def build_square_maze(size: int, seed: int, num_gates: int = 1) -> Maze:
     """Procedurally generate an NxN maze using seeded recursive backtracker.
     Places num_gates gates on distinct edges along the BFS shortest path.
+    Results are cached per (size, seed, num_gates) however the arguments are
+    passed; the shared Maze is read-only.
     """
+    return _build_square_maze(size, seed, num_gates)
+
+
+# lru_cache keys positional and keyword calls apart; build_square_maze always
+# calls this positionally, so equal arguments share one entry.
+@lru_cache(maxsize=32)
+def _build_square_maze(size: int, seed: int, num_gates: int) -> Maze:
     rng = random.Random(seed)
     width = height = size
     start = Position(0, 0)
     exit_pos = Position(size - 1, size - 1)
 
-    # Grid: each cell starts with all 4 walls (all directions blocked)
-    grid = _make_grid(width=width, height=height)
-    for pos in grid:
-        grid[pos]["blocked"] = {Direction.N, Direction.S, Direction.E, Direction.W}
-
-    # Iterative backtracker: carve passages (avoids RecursionError on large grids)
-    visited: set[Position] = {start}
-    stack: list[Position] = [start]
+    # Iterative backtracker over flat cell indices (avoids RecursionError on
+    # large grids). Every cell starts with all 4 walls; candidates are ranked
+    # in N, S, E, W order so the seeded draw matches Direction iteration.
+    n_cells = width * height
+    walls = bytearray([_ALL_WALLS]) * n_cells
+    visited = bytearray(n_cells)
+    start_idx = start.row * width + start.col
+    visited[start_idx] = 1
+    stack: list[int] = [start_idx]
+    # Carve-tree parent of each cell and the direction bit used to enter it.
+    # The backtracker yields a spanning tree, so the tree path from exit back
+    # to start is the unique (hence shortest) start->exit path.
+    parent_idx = [-1] * n_cells
+    parent_bit = bytearray(n_cells)
+    bit_n, bit_s, bit_e, bit_w = (_BIT[d] for d in _DIRECTIONS)
+    offset_of = {bit_n: -width, bit_s: width, bit_e: 1, bit_w: -1}
+    # Directions that stay on the grid from each cell, so the carve loop only
+    # tests bits instead of comparing row/col against the edges.
+    bounds = bytearray([_ALL_WALLS]) * n_cells
+    for c in range(width):
+        bounds[c] &= ~bit_n
+        bounds[(height - 1) * width + c] &= ~bit_s
+    for r in range(height):
+        bounds[r * width + width - 1] &= ~bit_e
+        bounds[r * width] &= ~bit_w
+    # Bound once: the carve loop draws and pushes once per cell.
+    randrange = rng.randrange
+    push = stack.append
     while stack:
-        pos = stack[-1]
-        unvisited_neighbors: list[tuple[Position, Direction]] = []
-        for d in Direction:
-            dr, dc = d.delta
-            nr, nc = pos.row + dr, pos.col + dc
-            if 0 <= nr < height and 0 <= nc < width:
-                npos = Position(nr, nc)
-                if npos not in visited:
-                    unvisited_neighbors.append((npos, d))
-        if unvisited_neighbors:
-            npos, d = rng.choice(unvisited_neighbors)
-            # Remove wall between pos and npos
-            grid[pos]["blocked"].discard(d)
-            grid[npos]["blocked"].discard(d.opposite)
-            visited.add(npos)
-            stack.append(npos)
+        idx = stack[-1]
+        inside = bounds[idx]
+        cand = 0
+        if inside & bit_n and not visited[idx - width]:
+            cand |= bit_n
+        if inside & bit_s and not visited[idx + width]:
+            cand |= bit_s
+        if inside & bit_e and not visited[idx + 1]:
+            cand |= bit_e
+        if inside & bit_w and not visited[idx - 1]:
+            cand |= bit_w
+        if cand:
+            # randrange(k) draws like rng.choice over the k candidates did.
+            bits = _MASK_BITS[cand]
+            bit = bits[randrange(len(bits))]
+            nidx = idx + offset_of[bit]
+            # Remove wall between the two cells
+            walls[idx] &= ~bit
+            walls[nidx] &= ~_OPPOSITE_BIT[bit]
+            visited[nidx] = 1
+            parent_idx[nidx] = idx
+            parent_bit[nidx] = bit
+            push(nidx)
         else:
             stack.pop()
 
+    grid = _make_grid(width=width, height=height)
+    for idx, item in enumerate(grid):
+        item["blocked"] = walls[idx]
+
     # Mark start and exit
-    grid[start]["kind"] = CellKind.START
-    grid[start]["title"] = "Ingress Port"
-    grid[start]["description"] = "You jack into the internal network."
-
-    grid[exit_pos]["kind"] = CellKind.EXIT
-    grid[exit_pos]["title"] = "Root Access Gateway"
-    grid[exit_pos]["description"] = "One final jump grants root shell."
-
-    # Find path from start to exit (BFS) to place gate on an edge along the path
-    path_edges: list[tuple[Position, Direction]] = []
-    q: list[Position] = [start]
-    parent: Dict[Position, tuple[Position, Direction] | None] = {start: None}
-    while q:
-        cur = q.pop(0)
-        if cur == exit_pos:
-            break
-        for d in Direction:
-            if d in grid[cur]["blocked"]:
-                continue
-            dr, dc = d.delta
-            npos = Position(cur.row + dr, cur.col + dc)
-            if npos not in parent:
-                parent[npos] = (cur, d)
-                q.append(npos)
-
-    # Reconstruct path edges
-    cur = exit_pos
-    while parent[cur] is not None:
-        prev, d = parent[cur]
-        path_edges.append((prev, d))
-        cur = prev
-
-    # Place num_gates gates on distinct random edges along the BFS path
-    gates_to_place = min(num_gates, len(path_edges))
-    chosen_edges = rng.sample(path_edges, gates_to_place)
-    for i, (gate_pos, gate_dir) in enumerate(chosen_edges):
-        gate_id = f"gate-dynamic-{seed}-{i}"
-        grid[gate_pos]["edge_gates"][gate_dir] = gate_id
-        dr, dc = gate_dir.delta
-        next_pos = Position(gate_pos.row + dr, gate_pos.col + dc)
-        grid[next_pos]["puzzle_id"] = gate_id
-        grid[next_pos]["title"] = "Firewall Lattice"
-        grid[next_pos]["description"] = "A challenge guards this route."
-
-    cells: Dict[Position, CellSpec] = {}
-    for pos, item in grid.items():
-        cells[pos] = CellSpec(
-            pos=pos,
-            kind=item["kind"],
-            title=item["title"],
-            description=item["description"],
-            blocked=frozenset(item["blocked"]),
-            puzzle_id=item["puzzle_id"],
-            edge_gates=dict(item["edge_gates"]),
-        )
+    exit_idx = exit_pos.row * width + exit_pos.col
+    grid[start_idx]["kind"] = CellKind.START
+    grid[start_idx]["title"] = "Ingress Port"
+    grid[start_idx]["description"] = "You jack into the internal network."
+
+    grid[exit_idx]["kind"] = CellKind.EXIT
+    grid[exit_idx]["title"] = "Root Access Gateway"
+    grid[exit_idx]["description"] = "One final jump grants root shell."
+
+    # Path cells from exit back to start (exclusive); each one identifies the
+    # edge it was entered through via parent_idx/parent_bit, so no edge tuples
+    # are built.
+    path_cells: list[int] = []
+    cur = exit_idx
+    while cur != start_idx:
+        path_cells.append(cur)
+        cur = parent_idx[cur]
+
+    # Place num_gates gates on distinct random edges along the start->exit path.
+    # Sampling positions draws the same indices as sampling the edges would.
+    gates_to_place = min(num_gates, len(path_cells))
+    for i, k in enumerate(rng.sample(range(len(path_cells)), gates_to_place)):
+        gated_idx = path_cells[k]
+        # Interned: the edge_gates value and puzzle_id share one object, and so
+        # do equal ids from other builds or from solved_gates on load.
+        gate_id = sys.intern(f"gate-dynamic-{seed}-{i}")
+        grid[parent_idx[gated_idx]]["edge_gates"][_DIR_BY_BIT[parent_bit[gated_idx]]] = gate_id
+        gated = grid[gated_idx]
+        gated["puzzle_id"] = gate_id
+        gated["title"] = "Firewall Lattice"
+        gated["description"] = "A challenge guards this route."
+
+    cells = _freeze_cells(grid, width)
 
     return Maze(
         maze_id=f"maze-{size}x{size}-v1",
@@ -289,3 +465,6 @@ def build_square_maze(size: int, seed: int, num_gates: int = 1) -> Maze:
         cells=cells,
     )
 
+
+# The uncached builder, as lru_cache exposes it on its own wrappers.
+build_square_maze.__wrapped__ = _build_square_maze.__wrapped__
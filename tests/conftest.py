@@ -21,26 +21,39 @@ def import_required(module_name: str):
         )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def maze_module():
     return import_required("maze")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_module():
     return import_required("db")
 
 
+@pytest.fixture(scope="session")
+def main_api():
+    """(GameEngine, Command) from main, resolved once per session."""
+    main = import_required("main")
+    engine_cls = getattr(main, "GameEngine", None)
+    cmd_cls = getattr(main, "Command", None)
+    assert engine_cls is not None, "main.GameEngine must exist per interfaces.md"
+    assert cmd_cls is not None, "main.Command must exist per interfaces.md"
+    return engine_cls, cmd_cls
+
+
 @pytest.fixture
 def repo(tmp_path, db_module):
-    """SQLite repository at tmp_path / game.db via open_repo."""
+    """SQLite repository at tmp_path / game.db via open_repo, closed afterwards."""
     fn = getattr(db_module, "open_repo", None)
-    if callable(fn):
-        return fn(tmp_path / "game.db")
-    pytest.fail(
-        "db module must provide open_repo(path). "
-        "See interfaces.md Section 4.3."
-    )
+    if not callable(fn):
+        pytest.fail(
+            "db module must provide open_repo(path). "
+            "See interfaces.md Section 4.3."
+        )
+    repo = fn(tmp_path / "game.db")
+    yield repo
+    repo.close()
 
 
 @pytest.fixture
@@ -48,7 +61,7 @@ def repo_path(tmp_path):
     return tmp_path / "game.db"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def procedural_maze(maze_module):
     """Seeded 5x5 maze with 2 gates for multi-gate tests."""
     build = getattr(maze_module, "build_square_maze", None)
@@ -56,6 +69,12 @@ def procedural_maze(maze_module):
     return build(size=5, seed=42, num_gates=2)
 
 
+@pytest.fixture(scope="session")
+def minimal_maze(maze_module):
+    """The hand-authored 3x3 maze. Mazes are frozen, so one instance is shared."""
+    return maze_module.build_minimal_3x3_maze()
+
+
 @dataclass(frozen=True)
 class _TestPuzzle:
     id: str
@@ -81,7 +100,7 @@ class _TestPuzzleRegistry:
         )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def puzzle_registry():
     return _TestPuzzleRegistry()
 
@@ -18,9 +18,8 @@ def _dir_token(direction) -> str:
     return getattr(direction, "name", str(direction))
 
 
-def _build_engine(maze_module, repo, puzzle_registry):
+def _build_engine(maze, repo, puzzle_registry):
     main = _import_required("main")
-    maze = maze_module.build_minimal_3x3_maze()
     player = repo.get_or_create_player("trinity")
     player_id = player["id"] if isinstance(player, dict) else player.id
     initial_state = {
@@ -47,52 +46,74 @@ def _build_engine(maze_module, repo, puzzle_registry):
 
 
 def _path_to_exit(maze):
+    # (row, col) tuple keys: C-level hashing instead of Position's dataclass
+    # __hash__/__eq__.
+    start_key = (maze.start.row, maze.start.col)
+    exit_key = (maze.exit.row, maze.exit.col)
     q = deque([maze.start])
-    prev = {maze.start: None}
+    prev = {start_key: None}
     prev_dir = {}
     while q:
         cur = q.popleft()
-        if cur == maze.exit:
+        cur_key = (cur.row, cur.col)
+        if cur_key == exit_key:
             break
         for d in maze.available_moves(cur):
             nxt = maze.next_pos(cur, d)
-            if nxt is None or nxt in prev:
+            if nxt is None:
                 continue
-            prev[nxt] = cur
-            prev_dir[nxt] = d
+            nxt_key = (nxt.row, nxt.col)
+            if nxt_key in prev:
+                continue
+            prev[nxt_key] = cur_key
+            prev_dir[nxt_key] = d
             q.append(nxt)
-    assert maze.exit in prev
-    dirs = []
-    cur = maze.exit
-    while cur != maze.start:
-        dirs.append(prev_dir[cur])
-        cur = prev[cur]
-    dirs.reverse()
-    return dirs
+    assert exit_key in prev
+    # Walking back from the exit, so prepend to get start->exit order.
+    dirs = deque()
+    cur_key = exit_key
+    while cur_key != start_key:
+        dirs.appendleft(prev_dir[cur_key])
+        cur_key = prev[cur_key]
+    return tuple(dirs)
+
+
+def _start_dir_partition(maze):
+    """The first gated and the first ungated move from the start."""
+    gated = ungated = None
+    start = maze.start
+    for d in maze.available_moves(start):
+        if maze.gate_id_for(start, d) is None:
+            ungated = ungated if ungated is not None else d
+        else:
+            gated = gated if gated is not None else d
+        if gated is not None and ungated is not None:
+            break
+    return gated, ungated
 
 
 def _first_gated_direction(maze):
-    for d in maze.available_moves(maze.start):
-        if maze.gate_id_for(maze.start, d) is not None:
-            return d
-    pytest.fail("Expected at least one gated direction from start.")
+    d = _start_dir_partition(maze)[0]
+    if d is None:
+        pytest.fail("Expected at least one gated direction from start.")
+    return d
 
 
 def _first_ungated_direction(maze):
-    for d in maze.available_moves(maze.start):
-        if maze.gate_id_for(maze.start, d) is None:
-            return d
-    pytest.fail("Expected at least one ungated direction from start.")
+    d = _start_dir_partition(maze)[1]
+    if d is None:
+        pytest.fail("Expected at least one ungated direction from start.")
+    return d
 
 
-def test_direction_parsing(maze_module, repo, puzzle_registry):
-    main, _, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_direction_parsing(minimal_maze, repo, puzzle_registry):
+    main, _, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     out = engine.handle(main.Command(verb="go", args=["E"]))
     assert out.view.pending_puzzle is not None
 
 
-def test_ungated_move_updates_position(maze_module, repo, puzzle_registry):
-    main, maze, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_ungated_move_updates_position(minimal_maze, repo, puzzle_registry):
+    main, maze, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     d = _first_ungated_direction(maze)
     before = engine.view().pos
     out = engine.handle(main.Command(verb="go", args=[_dir_token(d)]))
@@ -101,8 +122,8 @@ def test_ungated_move_updates_position(maze_module, repo, puzzle_registry):
     assert out.view.move_count == 1
 
 
-def test_gated_move_blocks_without_answer(maze_module, repo, puzzle_registry):
-    main, maze, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_gated_move_blocks_without_answer(minimal_maze, repo, puzzle_registry):
+    main, maze, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     d = _first_gated_direction(maze)
     before = engine.view().pos
     out = engine.handle(main.Command(verb="go", args=[_dir_token(d)]))
@@ -111,35 +132,38 @@ def test_gated_move_blocks_without_answer(maze_module, repo, puzzle_registry):
     assert out.view.move_count == 0
 
 
-def test_correct_answer_clears_pending_puzzle(maze_module, repo, puzzle_registry):
-    main, maze, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_correct_answer_clears_pending_puzzle(minimal_maze, repo, puzzle_registry):
+    main, maze, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     d = _first_gated_direction(maze)
     engine.handle(main.Command(verb="go", args=[_dir_token(d)]))
     out = engine.handle(main.Command(verb="answer", args=["solve"]))
     assert out.view.pending_puzzle is None
 
 
-def test_incorrect_answer_keeps_puzzle_pending(maze_module, repo, puzzle_registry):
-    main, maze, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_incorrect_answer_keeps_puzzle_pending(minimal_maze, repo, puzzle_registry):
+    main, maze, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     d = _first_gated_direction(maze)
     engine.handle(main.Command(verb="go", args=[_dir_token(d)]))
     out = engine.handle(main.Command(verb="answer", args=["wrong"]))
     assert out.view.pending_puzzle is not None
 
 
-def test_save_command_sets_did_persist(maze_module, repo, puzzle_registry):
-    main, _, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_save_command_sets_did_persist(minimal_maze, repo, puzzle_registry):
+    main, _, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     out = engine.handle(main.Command(verb="save", args=[]))
     assert out.did_persist is True
 
 
-def test_completion_records_score_once(maze_module, repo, puzzle_registry):
-    main, maze, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_completion_records_score_once(minimal_maze, repo, puzzle_registry):
+    main, maze, engine = _build_engine(minimal_maze, repo, puzzle_registry)
+    Command = main.Command
+    answer_cmd = Command(verb="answer", args=["solve"])
     for d in _path_to_exit(maze):
-        out = engine.handle(main.Command(verb="go", args=[_dir_token(d)]))
+        go_cmd = Command(verb="go", args=[_dir_token(d)])
+        out = engine.handle(go_cmd)
         while out.view.pending_puzzle is not None:
-            engine.handle(main.Command(verb="answer", args=["solve"]))
-            out = engine.handle(main.Command(verb="go", args=[_dir_token(d)]))
+            engine.handle(answer_cmd)
+            out = engine.handle(go_cmd)
     scores_before = len(repo.top_scores(maze_id=maze.maze_id, limit=50))
     engine.handle(main.Command(verb="save", args=[]))
     scores_after = len(repo.top_scores(maze_id=maze.maze_id, limit=50))
@@ -147,8 +171,8 @@ def test_completion_records_score_once(maze_module, repo, puzzle_registry):
     assert scores_after == 1
 
 
-def test_invalid_command_returns_error_message(maze_module, repo, puzzle_registry):
-    main, _, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_invalid_command_returns_error_message(minimal_maze, repo, puzzle_registry):
+    main, _, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     before = engine.view()
     out = engine.handle(main.Command(verb="warp", args=["now"]))
     after = engine.view()
@@ -157,10 +181,10 @@ def test_invalid_command_returns_error_message(maze_module, repo, puzzle_registr
     assert after.move_count == before.move_count
 
 
-def test_save_load_round_trip_preserves_state(maze_module, repo, puzzle_registry):
+def test_save_load_round_trip_preserves_state(minimal_maze, repo, puzzle_registry):
     """Create engine, make moves, save, then create a NEW engine from same
     game_id and verify state was reconstructed correctly."""
-    main, maze, engine = _build_engine(maze_module, repo, puzzle_registry)
+    main, maze, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     d = _first_ungated_direction(maze)
     engine.handle(main.Command(verb="go", args=[_dir_token(d)]))
     engine.handle(main.Command(verb="save", args=[]))
@@ -182,9 +206,9 @@ def test_save_load_round_trip_preserves_state(maze_module, repo, puzzle_registry
     assert restored_view.is_complete == saved_view.is_complete
 
 
-def test_short_form_direction_verbs(maze_module, repo, puzzle_registry):
+def test_short_form_direction_verbs(minimal_maze, repo, puzzle_registry):
     """Bare n/s/e/w verbs should work like 'go N/S/E/W'."""
-    main, maze, engine = _build_engine(maze_module, repo, puzzle_registry)
+    main, maze, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     d = _first_ungated_direction(maze)
     token = _dir_token(d).lower()  # e.g. "s"
     before = engine.view().pos
@@ -193,8 +217,8 @@ def test_short_form_direction_verbs(maze_module, repo, puzzle_registry):
     assert out.view.move_count == 1
 
 
-def test_look_command_returns_current_view(maze_module, repo, puzzle_registry):
-    main, _, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_look_command_returns_current_view(minimal_maze, repo, puzzle_registry):
+    main, _, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     baseline = engine.view()
     out = engine.handle(main.Command(verb="look", args=[]))
     assert out.view.pos == baseline.pos
@@ -202,16 +226,16 @@ def test_look_command_returns_current_view(maze_module, repo, puzzle_registry):
     assert out.did_persist is False
 
 
-def test_map_command_returns_current_view(maze_module, repo, puzzle_registry):
-    main, _, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_map_command_returns_current_view(minimal_maze, repo, puzzle_registry):
+    main, _, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     baseline = engine.view()
     out = engine.handle(main.Command(verb="map", args=[]))
     assert out.view.pos == baseline.pos
     assert out.did_persist is False
 
 
-def test_answer_without_pending_puzzle(maze_module, repo, puzzle_registry):
-    main, _, engine = _build_engine(maze_module, repo, puzzle_registry)
+def test_answer_without_pending_puzzle(minimal_maze, repo, puzzle_registry):
+    main, _, engine = _build_engine(minimal_maze, repo, puzzle_registry)
     out = engine.handle(main.Command(verb="answer", args=["something"]))
     assert "No pending puzzle" in out.messages[0]
     assert out.did_persist is False
@@ -8,9 +8,25 @@ def _all_positions(maze_mod, maze_obj):
     if Position is None:
         raise AssertionError("maze.Position dataclass must exist per interfaces.md")
 
-    for r in range(maze_obj.height):
-        for c in range(maze_obj.width):
-            yield Position(row=r, col=c)
+    # Positional args: Position is a plain (row, col) dataclass.
+    cols = range(maze_obj.width)
+    return [Position(r, c) for r in range(maze_obj.height) for c in cols]
+
+
+def _snapshot(maze_mod, maze_obj):
+    """
+    pos -> (available_moves(pos), {direction: gate_id_for(pos, direction)}, puzzle_id_at(pos)),
+    read through the public API for the per-cell tests.
+    """
+    directions = tuple(maze_mod.Direction)
+    return {
+        pos: (
+            maze_obj.available_moves(pos),
+            {d: maze_obj.gate_id_for(pos, d) for d in directions},
+            maze_obj.puzzle_id_at(pos),
+        )
+        for pos in _all_positions(maze_mod, maze_obj)
+    }
 
 
 def _bfs_path_edges(maze_mod, maze_obj):
@@ -19,31 +35,44 @@ def _bfs_path_edges(maze_mod, maze_obj):
     goal = maze_obj.exit
     Position = maze_mod.Position
 
+    # Keyed by (row, col) tuples, which hash in C; the Positions the edges
+    # report are kept as the values.
+    goal_key = (goal.row, goal.col)
     q = deque([start])
-    prev = {start: None}
+    prev = {(start.row, start.col): None}
     prev_dir = {}
 
     while q:
         cur = q.popleft()
-        if cur == goal:
+        if (cur.row, cur.col) == goal_key:
             break
         for d in maze_obj.available_moves(cur):
             nxt = maze_obj.next_pos(cur, d)
-            if nxt is None or nxt in prev:
+            if nxt is None:
+                continue
+            nxt_key = (nxt.row, nxt.col)
+            if nxt_key in prev:
                 continue
-            prev[nxt] = cur
-            prev_dir[nxt] = d
+            prev[nxt_key] = cur
+            prev_dir[nxt_key] = d
             q.append(nxt)
 
-    assert goal in prev, "Exit must be reachable from start"
+    assert goal_key in prev, "Exit must be reachable from start"
 
-    edges = []
+    # Size the list from the parent-chain length, then fill it back to front
+    # while walking from the goal, so it comes out in start->goal order.
+    depth = 0
     cur = goal
     while cur != start:
-        p = prev[cur]
-        edges.append((p, prev_dir[cur]))
+        depth += 1
+        cur = prev[(cur.row, cur.col)]
+    edges = [None] * depth
+    cur = goal
+    for i in range(depth - 1, -1, -1):
+        cur_key = (cur.row, cur.col)
+        p = prev[cur_key]
+        edges[i] = (p, prev_dir[cur_key])
         cur = p
-    edges.reverse()
     return edges
 
 
@@ -60,9 +89,9 @@ def test_available_moves_match_next_pos(maze_module):
     maze = maze_module.build_minimal_3x3_maze()
     Direction = getattr(maze_module, "Direction", None)
     assert Direction is not None, "maze.Direction Enum must exist per interfaces.md"
+    all_directions = frozenset(Direction)
 
-    for pos in _all_positions(maze_module, maze):
-        moves = maze.available_moves(pos)
+    for pos, (moves, _, _) in _snapshot(maze_module, maze).items():
         assert isinstance(moves, (set, list, tuple)), "available_moves must return a collection of Directions"
 
         # For moves the maze claims are available, next_pos must succeed.
@@ -72,31 +101,69 @@ def test_available_moves_match_next_pos(maze_module):
             assert maze.in_bounds(nxt), f"next_pos returned out-of-bounds position {nxt} from {pos} via {d}"
 
         # For directions not in moves, next_pos must return None.
-        for d in list(Direction):
-            if d in moves:
-                continue
+        for d in all_directions - frozenset(moves):
             assert maze.next_pos(pos, d) is None
 
 
-def test_exit_reachable_from_start_via_public_api(maze_module):
-    maze = maze_module.build_minimal_3x3_maze()
+def _neighbours(maze, pos):
+    return [nxt for d in maze.available_moves(pos) if (nxt := maze.next_pos(pos, d)) is not None]
+
 
-    q = deque([maze.start])
-    seen = {maze.start}
+def _reachable_one_way(maze, start, goal):
+    q = deque([start])
+    seen = {start}
 
     while q:
         cur = q.popleft()
-        if cur == maze.exit:
-            return
+        if cur == goal:
+            return True
 
-        for d in maze.available_moves(cur):
-            nxt = maze.next_pos(cur, d)
-            if nxt is None or nxt in seen:
+        for nxt in _neighbours(maze, cur):
+            if nxt in seen:
                 continue
             seen.add(nxt)
             q.append(nxt)
 
-    raise AssertionError("maze.exit is not reachable from maze.start using only available_moves/next_pos")
+    return False
+
+
+def _reachable_two_way(maze, start, goal):
+    """Bidirectional BFS; returns None if an asymmetric edge is seen on the way."""
+    if start == goal:
+        return True
+
+    frontiers = [[start], [goal]]
+    seens = [{start}, {goal}]
+
+    while frontiers[0] and frontiers[1]:
+        # Grow the smaller frontier by one full level.
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        seen, other = seens[side], seens[1 - side]
+        level = []
+        for cur in frontiers[side]:
+            for nxt in _neighbours(maze, cur):
+                # Walking backward from the exit is only sound if each edge
+                # can be taken in both directions.
+                if cur not in _neighbours(maze, nxt):
+                    return None
+                if nxt in other:
+                    return True
+                if nxt not in seen:
+                    seen.add(nxt)
+                    level.append(nxt)
+        frontiers[side] = level
+
+    return False
+
+
+def test_exit_reachable_from_start_via_public_api(maze_module):
+    maze = maze_module.build_minimal_3x3_maze()
+
+    reachable = _reachable_two_way(maze, maze.start, maze.exit)
+    if reachable is None:
+        reachable = _reachable_one_way(maze, maze.start, maze.exit)
+
+    assert reachable, "maze.exit is not reachable from maze.start using only available_moves/next_pos"
 
 
 def test_gate_and_puzzle_hooks_are_stable(maze_module):
@@ -104,12 +171,11 @@ def test_gate_and_puzzle_hooks_are_stable(maze_module):
     Direction = getattr(maze_module, "Direction", None)
     assert Direction is not None
 
-    for pos in _all_positions(maze_module, maze):
-        pid = maze.puzzle_id_at(pos)
+    for pos, (_, gates, pid) in _snapshot(maze_module, maze).items():
         assert pid is None or isinstance(pid, str)
 
-        for d in list(Direction):
-            gid = maze.gate_id_for(pos, d)
+        # The snapshot holds one entry per Direction member.
+        for gid in gates.values():
             assert gid is None or isinstance(gid, str)
 
 
@@ -142,8 +208,11 @@ def test_build_square_maze_is_deterministic(maze_module):
     build = getattr(maze_module, "build_square_maze", None)
     assert build is not None, "maze.build_square_maze must exist per interfaces.md"
 
+    # The factory memoizes; go around the cache so both mazes are really built.
+    build = getattr(build, "__wrapped__", build)
     maze_a = build(size=5, seed=99, num_gates=2)
     maze_b = build(size=5, seed=99, num_gates=2)
+    assert maze_a is not maze_b
 
     for pos in _all_positions(maze_module, maze_a):
         cell_a = maze_a.cell(pos)
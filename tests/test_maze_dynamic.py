@@ -1,43 +1,94 @@
 from collections import deque
+from types import SimpleNamespace
 
+import pytest
 
-def _reachable(maze):
+
+def _walk_and_collect(maze, directions):
+    """BFS the whole component once, recording every gate seen on the way.
+
+    Returns (seen, gates): visited cells as (row, col) tuples, which hash in C,
+    and the gate ids found on any side of a visited cell.
+    """
     q = deque([maze.start])
-    seen = {maze.start}
+    seen = {(maze.start.row, maze.start.col)}
+    gates = []
     while q:
         cur = q.popleft()
-        if cur == maze.exit:
-            return True
+        for direction in directions:
+            gate = maze.gate_id_for(cur, direction)
+            if gate is not None:
+                gates.append(gate)
         for direction in maze.available_moves(cur):
             nxt = maze.next_pos(cur, direction)
-            if nxt is None or nxt in seen:
+            if nxt is None:
+                continue
+            nxt_key = (nxt.row, nxt.col)
+            if nxt_key in seen:
                 continue
-            seen.add(nxt)
+            seen.add(nxt_key)
             q.append(nxt)
-    return False
+    return seen, gates
+
+
+@pytest.fixture(scope="module", params=[(7, 11), (9, 3), (8, 2)], ids=lambda p: f"size{p[0]}-seed{p[1]}")
+def square_maze(request, maze_module):
+    """One seeded square maze per (size, seed), shared by every test below."""
+    size, seed = request.param
+    return maze_module.build_square_maze(size=size, seed=seed)
+
 
+@pytest.fixture(scope="module")
+def square_walk(maze_module, square_maze):
+    """The single traversal of square_maze that the checks below assert on."""
+    seen, gates = _walk_and_collect(square_maze, tuple(maze_module.Direction))
+    return SimpleNamespace(maze=square_maze, seen=seen, gates=gates)
 
-def test_build_square_maze_size_and_bounds(maze_module):
-    maze = maze_module.build_square_maze(size=7, seed=11)
-    assert maze.width == 7
-    assert maze.height == 7
+
+def test_build_square_maze_size_and_bounds(square_maze, request):
+    size, _ = request.node.callspec.params["square_maze"]
+    maze = square_maze
+    assert maze.width == size
+    assert maze.height == size
     assert maze.in_bounds(maze.start)
     assert maze.in_bounds(maze.exit)
 
 
-def test_build_square_maze_exit_is_reachable(maze_module):
-    maze = maze_module.build_square_maze(size=9, seed=3)
-    assert _reachable(maze)
+def test_build_square_maze_exit_is_reachable(square_walk):
+    maze = square_walk.maze
+    assert (maze.exit.row, maze.exit.col) in square_walk.seen
 
 
-def test_build_square_maze_places_at_least_one_gate(maze_module):
-    maze = maze_module.build_square_maze(size=8, seed=2)
-    gates = []
+def test_build_square_maze_places_at_least_one_gate(square_walk):
+    # Generated mazes are spanning trees, so the walk visits every cell.
+    maze = square_walk.maze
+    assert len(square_walk.seen) == maze.width * maze.height
+    assert square_walk.gates
+
+
+def test_packed_maze_matches_cells(maze_module):
+    maze = maze_module.build_square_maze(size=6, seed=5, num_gates=2)
+    packed = maze.pack()
+    assert len(packed.data) == 16 * maze.width * maze.height
     for row in range(maze.height):
         for col in range(maze.width):
-            pos = maze_module.Position(row=row, col=col)
+            cell = maze.cell(maze_module.Position(row=row, col=col))
+            assert packed.blocked_mask(row, col) == cell.blocked_mask
+            assert packed.kind(row, col) is cell.kind
+            assert packed.puzzle_id(row, col) == cell.puzzle_id
             for direction in maze_module.Direction:
-                gate = maze.gate_id_for(pos, direction)
-                if gate is not None:
-                    gates.append(gate)
-    assert gates
+                assert packed.gate_id(row, col, direction) == cell.edge_gates.get(direction)
+
+
+def test_cached_maze_is_shared_read_only(maze_module):
+    build = maze_module.build_square_maze
+    maze = build(size=5, seed=42, num_gates=2)
+    # One cache entry however the arguments are spelled.
+    assert build(5, 42, 2) is maze
+    assert build(5, seed=42, num_gates=2) is maze
+
+    start = maze.start
+    with pytest.raises(TypeError):
+        maze.cells[start] = maze.cells[maze.exit]
+    with pytest.raises(TypeError):
+        maze.cell(start).edge_gates[maze_module.Direction.S] = "gate-x"
@@ -4,12 +4,17 @@ import pytest
 
 
 @pytest.fixture
-def sqlite_repo(db_module, tmp_path):
-    """Provide a SqliteGameRepository for question bank tests."""
+def sqlite_repo(db_module):
+    """Provide an in-memory SqliteGameRepository for question bank tests.
+
+    Nothing here reopens the database, so no file (or fsync) is needed.
+    """
     repo_cls = getattr(db_module, "SqliteGameRepository", None)
     if repo_cls is None:
         pytest.fail("SqliteGameRepository not implemented yet (design contract)")
-    return repo_cls(tmp_path / "questions.db")
+    repo = repo_cls(":memory:")
+    yield repo
+    repo.close()
 
 
 def test_seed_and_fetch_question(sqlite_repo):
@@ -41,11 +46,9 @@ def test_mark_question_asked_excludes_from_future(sqlite_repo):
     asked_id = q1["id"]
     sqlite_repo.mark_question_asked(asked_id)
 
-    for _ in range(10):
-        q = sqlite_repo.get_random_question()
-        if q is None:
-            break
-        assert q["id"] != asked_id, "Previously asked question should not be returned"
+    available = sqlite_repo.list_available_question_ids()
+    assert asked_id not in available, "Previously asked question should not be returned"
+    assert sorted(available) == sorted({"q1", "q2"} - {asked_id})
 
 
 def test_all_questions_exhausted_returns_none(sqlite_repo):
@@ -78,3 +81,66 @@ def test_reset_questions(sqlite_repo):
     q2 = sqlite_repo.get_random_question()
     assert q2 is not None
     assert q2["id"] == "q1"
+
+
+def test_draws_see_writes_from_another_repository(db_module, tmp_path):
+    """Questions marked or reset through a second repo are seen on the next draw."""
+    path = tmp_path / "questions.db"
+    first = db_module.SqliteGameRepository(path)
+    second = db_module.SqliteGameRepository(path)
+    try:
+        first.seed_questions([
+            {"id": f"q{i}", "question_text": f"Q{i}", "correct_answer": "a", "category": "x"}
+            for i in range(3)
+        ])
+        assert first.get_random_question() is not None
+
+        for qid in ("q0", "q1"):
+            second.mark_question_asked(qid)
+        for _ in range(10):
+            assert first.get_random_question()["id"] == "q2"
+
+        second.mark_question_asked("q2")
+        assert first.get_random_question() is None
+
+        second.reset_questions()
+        assert first.get_random_question() is not None
+    finally:
+        first.close()
+        second.close()
+
+
+def test_category_filter_draws_only_matching_questions(sqlite_repo):
+    """Category filter is applied in SQL; every unasked match is reachable."""
+    questions = [
+        {"id": f"m{i}", "question_text": f"M{i}", "correct_answer": "a", "category": "math"}
+        for i in range(3)
+    ] + [{"id": "h1", "question_text": "H1", "correct_answer": "a", "category": "history"}]
+    sqlite_repo.seed_questions(questions)
+
+    seen = set()
+    while (q := sqlite_repo.get_random_question("math")) is not None:
+        assert q["category"] == "math"
+        seen.add(q["id"])
+        sqlite_repo.mark_question_asked(q["id"])
+    assert seen == {"m0", "m1", "m2"}
+    assert sqlite_repo.get_random_question("history")["id"] == "h1"
+
+
+def test_seed_builtin_hacker_bank(db_module, sqlite_repo):
+    """The built-in bank seeds idempotently, including entries appended to it."""
+    bank = db_module.HACKER_SEED_QUESTIONS
+    bank.append({"id": "extra", "question_text": "Q", "correct_answer": "a", "category": "x"})
+    try:
+        sqlite_repo.seed_questions(bank)
+        sqlite_repo.seed_questions(bank)
+        expected = {q["id"] for q in bank}
+    finally:
+        bank.pop()
+
+    ids = set()
+    while (q := sqlite_repo.get_random_question()) is not None:
+        ids.add(q["id"])
+        sqlite_repo.mark_question_asked(q["id"])
+    assert "extra" in ids
+    assert ids == expected
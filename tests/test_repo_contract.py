@@ -1,99 +1,95 @@
+import contextlib
+
 import pytest
 
+# Shared starting state; tests build new dicts from it rather than mutating it.
+_INITIAL_STATE = {"pos": {"row": 0, "col": 0}, "move_count": 0, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"}
+
+
+def _get(obj, key):
+    # Repos may return dicts or objects; read a field from either.
+    return obj[key] if isinstance(obj, dict) else getattr(obj, key)
+
+
+@pytest.fixture
+def neo_player(repo):
+    """The "neo" player in this test's repo (repo is per test, so this is too)."""
+    return repo.get_or_create_player("neo")
+
 
 def test_get_or_create_player_is_idempotent(repo):
     p1 = repo.get_or_create_player("neo")
     p2 = repo.get_or_create_player("neo")
 
-    assert p1["id"] == p2["id"] if isinstance(p1, dict) else p1.id == p2.id
+    assert _get(p1, "id") == _get(p2, "id")
 
 
-def test_create_and_get_game_round_trip(repo):
-    player = repo.get_or_create_player("neo")
-    player_id = player["id"] if isinstance(player, dict) else player.id
+def test_create_and_get_game_round_trip(repo, neo_player):
+    player_id = _get(neo_player, "id")
 
-    initial_state = {"pos": {"row": 0, "col": 0}, "move_count": 0, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"}
-    game = repo.create_game(player_id=player_id, maze_id="maze-3x3-v1", maze_version="1.0", initial_state=initial_state)
-    game_id = game["id"] if isinstance(game, dict) else game.id
+    game = repo.create_game(player_id=player_id, maze_id="maze-3x3-v1", maze_version="1.0", initial_state=_INITIAL_STATE)
+    game_id = _get(game, "id")
 
     loaded = repo.get_game(game_id)
     assert loaded is not None
 
-    if isinstance(loaded, dict):
-        assert loaded["player_id"] == player_id
-        assert loaded["maze_id"] == "maze-3x3-v1"
-        assert loaded["maze_version"] == "1.0"
-        assert loaded["state"] == initial_state
-        assert loaded["status"] in ("in_progress", "completed")
-    else:
-        assert loaded.player_id == player_id
-        assert loaded.maze_id == "maze-3x3-v1"
-        assert loaded.maze_version == "1.0"
-        assert loaded.state == initial_state
-        assert loaded.status in ("in_progress", "completed")
-
-
-def test_save_game_updates_state_and_status(repo):
-    player = repo.get_or_create_player("neo")
-    player_id = player["id"] if isinstance(player, dict) else player.id
+    assert _get(loaded, "player_id") == player_id
+    assert _get(loaded, "maze_id") == "maze-3x3-v1"
+    assert _get(loaded, "maze_version") == "1.0"
+    assert _get(loaded, "state") == _INITIAL_STATE
+    assert _get(loaded, "status") in ("in_progress", "completed")
 
-    initial_state = {"pos": {"row": 0, "col": 0}, "move_count": 0, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"}
-    game = repo.create_game(player_id=player_id, maze_id="maze-3x3-v1", maze_version="1.0", initial_state=initial_state)
-    game_id = game["id"] if isinstance(game, dict) else game.id
 
-    new_state = {**initial_state, "move_count": 3, "pos": {"row": 1, "col": 1}}
-    updated = repo.save_game(game_id=game_id, state=new_state, status="completed")
+def test_save_game_updates_state_and_status(repo, neo_player):
+    player_id = _get(neo_player, "id")
 
-    if isinstance(updated, dict):
-        assert updated["state"] == new_state
-        assert updated["status"] == "completed"
-        assert updated["updated_at"] >= updated["created_at"]
-    else:
-        assert updated.state == new_state
-        assert updated.status == "completed"
-        assert updated.updated_at >= updated.created_at
+    game = repo.create_game(player_id=player_id, maze_id="maze-3x3-v1", maze_version="1.0", initial_state=_INITIAL_STATE)
+    game_id = _get(game, "id")
 
+    new_state = {**_INITIAL_STATE, "move_count": 3, "pos": {"row": 1, "col": 1}}
+    updated = repo.save_game(game_id=game_id, state=new_state, status="completed")
 
-def test_record_score_and_top_scores_ordering(repo):
-    player = repo.get_or_create_player("neo")
-    player_id = player["id"] if isinstance(player, dict) else player.id
-
-    initial_state = {"pos": {"row": 0, "col": 0}, "move_count": 0, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"}
-    game = repo.create_game(player_id=player_id, maze_id="maze-3x3-v1", maze_version="1.0", initial_state=initial_state)
-    game_id = game["id"] if isinstance(game, dict) else game.id
-
-    repo.record_score(
-        player_id=player_id,
-        game_id=game_id,
-        maze_id="maze-3x3-v1",
-        maze_version="1.0",
-        metrics={"elapsed_seconds": 12, "moves": 20},
-    )
-    repo.record_score(
-        player_id=player_id,
-        game_id=game_id,
-        maze_id="maze-3x3-v1",
-        maze_version="1.0",
-        metrics={"elapsed_seconds": 9, "moves": 40},
-    )
-    repo.record_score(
-        player_id=player_id,
-        game_id=game_id,
-        maze_id="maze-3x3-v1",
-        maze_version="1.0",
-        metrics={"elapsed_seconds": 9, "moves": 10},
-    )
+    assert _get(updated, "state") == new_state
+    assert _get(updated, "status") == "completed"
+    assert _get(updated, "updated_at") >= _get(updated, "created_at")
+
+
+def test_record_score_and_top_scores_ordering(repo, neo_player):
+    player_id = _get(neo_player, "id")
+
+    game = repo.create_game(player_id=player_id, maze_id="maze-3x3-v1", maze_version="1.0", initial_state=_INITIAL_STATE)
+    game_id = _get(game, "id")
+
+    # One commit for the three inserts where the repo supports grouping them.
+    transaction = getattr(repo, "transaction", contextlib.nullcontext)
+    with transaction():
+        repo.record_score(
+            player_id=player_id,
+            game_id=game_id,
+            maze_id="maze-3x3-v1",
+            maze_version="1.0",
+            metrics={"elapsed_seconds": 12, "moves": 20},
+        )
+        repo.record_score(
+            player_id=player_id,
+            game_id=game_id,
+            maze_id="maze-3x3-v1",
+            maze_version="1.0",
+            metrics={"elapsed_seconds": 9, "moves": 40},
+        )
+        repo.record_score(
+            player_id=player_id,
+            game_id=game_id,
+            maze_id="maze-3x3-v1",
+            maze_version="1.0",
+            metrics={"elapsed_seconds": 9, "moves": 10},
+        )
 
     top2 = repo.top_scores(maze_id="maze-3x3-v1", limit=2)
     assert len(top2) == 2
 
-    def metrics(item):
-        if isinstance(item, dict):
-            return item["metrics"]
-        return item.metrics
-
-    m0 = metrics(top2[0])
-    m1 = metrics(top2[1])
+    m0 = _get(top2[0], "metrics")
+    m1 = _get(top2[1], "metrics")
     assert (m0["elapsed_seconds"], m0["moves"]) <= (m1["elapsed_seconds"], m1["moves"])
     assert (m0["elapsed_seconds"], m0["moves"]) == (9, 10)
 
@@ -1,58 +1,546 @@
-from pathlib import Path
+import gc
+import sqlite3
+import threading
 
+import pytest
+from sqlalchemy import text
 
-def test_open_repo_selects_sqlite(db_module, tmp_path):
-    path = tmp_path / "state.db"
-    repo = db_module.open_repo(path)
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "state.db"
+
+
+@pytest.fixture
+def open_sqlite(db_module, path):
+    """Open SqliteGameRepository instances (at ``path`` by default); all closed afterwards."""
+    repos = []
+
+    def open_(at=path):
+        repos.append(db_module.SqliteGameRepository(at))
+        return repos[-1]
+
+    yield open_
+    for repo in repos:
+        repo.close()
+
+
+def test_open_repo_selects_sqlite(repo):
     assert repo.__class__.__name__ == "SqliteGameRepository"
 
 
-def test_sqlite_repo_round_trip_and_ordering(db_module, tmp_path):
-    repo_cls = getattr(db_module, "SqliteGameRepository")
-    repo = repo_cls(tmp_path / "state.db")
+def test_sqlite_repo_round_trip_and_ordering(repo):
+    # One commit for every write in the flow.
+    with repo.transaction():
+        player = repo.get_or_create_player("neo")
+        game = repo.create_game(
+            player_id=player["id"],
+            maze_id="maze-5x5-v1",
+            maze_version="1.0",
+            initial_state={"pos": {"row": 0, "col": 0}, "move_count": 0, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"},
+        )
+
+        repo.save_game(
+            game_id=game["id"],
+            state={"pos": {"row": 1, "col": 1}, "move_count": 2, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"},
+            status="in_progress",
+        )
+        loaded = repo.get_game(game["id"])
+        assert loaded is not None
+        assert loaded["state"]["move_count"] == 2
 
+        # One executemany for all three scores.
+        score = {"player_id": player["id"], "game_id": game["id"], "maze_id": "maze-5x5-v1", "maze_version": "1.0"}
+        repo.record_scores_bulk(
+            [
+                {**score, "metrics": {"elapsed_seconds": 12, "moves": 40}},
+                {**score, "metrics": {"elapsed_seconds": 9, "moves": 30}},
+                {**score, "metrics": {"elapsed_seconds": 9, "moves": 10}},
+            ]
+        )
+
+    top = repo.top_scores(maze_id="maze-5x5-v1", limit=2)
+    assert len(top) == 2
+    assert (top[0]["metrics"]["elapsed_seconds"], top[0]["metrics"]["moves"]) == (9, 10)
+
+
+def test_top_scores_ranks_missing_metrics_last(repo):
     player = repo.get_or_create_player("neo")
-    game = repo.create_game(
-        player_id=player["id"],
-        maze_id="maze-5x5-v1",
-        maze_version="1.0",
-        initial_state={"pos": {"row": 0, "col": 0}, "move_count": 0, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"},
+
+    repo.record_score(
+        player_id=player["id"], game_id="g1", maze_id="maze-3x3-v1", maze_version="1.0",
+        metrics={"moves": 1},
     )
+    repo.record_score(
+        player_id=player["id"], game_id="g2", maze_id="maze-3x3-v1", maze_version="1.0",
+        metrics={"elapsed_seconds": 30, "moves": 50},
+    )
+
+    top = repo.top_scores(maze_id="maze-3x3-v1", limit=10)
+    assert [s["game_id"] for s in top] == ["g2", "g1"]
+    assert top[1]["metrics"] == {"moves": 1}
+
+
+def test_top_scores_rank_only_rebuilds_metrics_from_columns(repo):
+    repo.record_score("p1", "g1", "m", "1.0", {"elapsed_seconds": 9, "moves": 30, "puzzles_solved": 2})
+    repo.record_score("p1", "g2", "m", "1.0", {"elapsed_seconds": 4.5})
+
+    full = repo.top_scores(maze_id="m")
+    ranks = repo.top_scores(maze_id="m", rank_only=True)
+    assert [s["game_id"] for s in ranks] == [s["game_id"] for s in full] == ["g2", "g1"]
+    assert full[1]["metrics"]["puzzles_solved"] == 2
+    assert ranks[0]["metrics"] == {"elapsed_seconds": 4.5}
+    assert ranks[1]["metrics"] == {"elapsed_seconds": 9, "moves": 30}
+    assert type(ranks[1]["metrics"]["moves"]) is int
+
+    # No limit: every score, still best-first.
+    repo.record_score("p1", "g3", "m", "1.0", {"elapsed_seconds": 1, "moves": 99})
+    assert [s["game_id"] for s in repo.top_scores(maze_id="m", limit=None)] == ["g3", "g2", "g1"]
+
 
-    repo.save_game(
-        game_id=game["id"],
-        state={"pos": {"row": 1, "col": 1}, "move_count": 2, "solved_gates": [], "started_at": "2026-02-13T00:00:00Z"},
-        status="in_progress",
+def test_top_scores_query_uses_leaderboard_index(repo):
+    with repo.engine.connect() as conn:
+        plan = conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM scores WHERE maze_id = 'm' "
+            "ORDER BY elapsed_seconds, moves LIMIT 10"
+        )).all()
+    details = " ".join(str(row[-1]) for row in plan)
+    assert "ix_scores_maze_elapsed_moves" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_top_scores_cache_is_invalidated_by_record_score(repo):
+    player = repo.get_or_create_player("neo")
+
+    repo.record_score(
+        player_id=player["id"], game_id="g1", maze_id="maze-3x3-v1", maze_version="1.0",
+        metrics={"elapsed_seconds": 20, "moves": 5},
     )
-    loaded = repo.get_game(game["id"])
-    assert loaded is not None
-    assert loaded["state"]["move_count"] == 2
+    assert len(repo.top_scores(maze_id="maze-3x3-v1")) == 1
 
     repo.record_score(
-        player_id=player["id"],
-        game_id=game["id"],
-        maze_id="maze-5x5-v1",
-        maze_version="1.0",
-        metrics={"elapsed_seconds": 12, "moves": 40},
+        player_id=player["id"], game_id="g2", maze_id="maze-3x3-v1", maze_version="1.0",
+        metrics={"elapsed_seconds": 10, "moves": 5},
     )
+    top = repo.top_scores(maze_id="maze-3x3-v1")
+    assert [s["game_id"] for s in top] == ["g2", "g1"]
+
+
+def test_top_scores_cached_results_are_not_shared_with_callers(repo):
     repo.record_score(
-        player_id=player["id"],
-        game_id=game["id"],
-        maze_id="maze-5x5-v1",
-        maze_version="1.0",
-        metrics={"elapsed_seconds": 9, "moves": 30},
+        player_id="p1", game_id="g1", maze_id="maze-3x3-v1", maze_version="1.0",
+        metrics={"elapsed_seconds": 20, "moves": 5},
+    )
+
+    for rank_only in (False, True):
+        first = repo.top_scores(maze_id="maze-3x3-v1", rank_only=rank_only)
+        first[0]["game_id"] = "tampered"
+        first[0]["metrics"]["moves"] = 99
+        first.clear()
+
+        again = repo.top_scores(maze_id="maze-3x3-v1", rank_only=rank_only)
+        assert again[0]["game_id"] == "g1"
+        assert again[0]["metrics"] == {"elapsed_seconds": 20, "moves": 5}
+
+
+def test_sqlite_repo_uses_wal_journal(db_module, repo):
+    with repo.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA mmap_size")).scalar() == db_module._SQLITE_MMAP_SIZE
+
+
+def test_record_scores_bulk_inserts_and_ranks(db_module, repo):
+    player = repo.get_or_create_player("neo")
+    assert repo.record_scores_bulk([]) == []
+
+    items = [
+        {
+            "player_id": player["id"], "game_id": f"g{i}", "maze_id": "maze-3x3-v1",
+            "maze_version": "1.0", "metrics": {"elapsed_seconds": secs, "moves": 5},
+        }
+        for i, secs in enumerate([30, 10, 20])
+    ]
+    records = repo.record_scores_bulk(items)
+    assert [r["game_id"] for r in records] == ["g0", "g1", "g2"]
+    assert len({r["id"] for r in records}) == 3
+    assert records[0]["metrics"] == {"elapsed_seconds": 30, "moves": 5}
+
+    top = repo.top_scores(maze_id="maze-3x3-v1")
+    assert [s["game_id"] for s in top] == ["g1", "g2", "g0"]
+
+    # Enough rows to split across multi-VALUES chunks, plus a single-row call.
+    n = 2 * db_module._SCORE_ROWS_PER_INSERT + 1
+    many = [{**items[0], "game_id": f"m{i}", "maze_id": "maze-big"} for i in range(n)]
+    repo.record_scores_bulk(many)
+    repo.record_scores_bulk(many[:1])
+    assert len(repo.top_scores(maze_id="maze-big", limit=n + 10)) == n + 1
+
+
+def test_player_lookup_by_handle_uses_index(repo):
+    first = repo.get_or_create_player("neo")
+    assert repo.get_or_create_player("neo") == first
+    with repo.engine.connect() as conn:
+        plan = conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM players WHERE handle = 'neo'"
+        )).all()
+    assert "ix_players_handle" in " ".join(str(row[-1]) for row in plan)
+
+
+def test_legacy_scores_table_is_migrated_in_place(open_sqlite, path):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE scores (id VARCHAR PRIMARY KEY, player_id VARCHAR, game_id VARCHAR, "
+        "maze_id VARCHAR, maze_version VARCHAR, metrics VARCHAR, created_at VARCHAR)"
+    )
+    conn.executemany(
+        "INSERT INTO scores VALUES (?, 'p1', ?, 'maze-3x3-v1', '1.0', ?, '2024-01-01T00:00:00Z')",
+        [
+            ("s1", "g1", '{"elapsed_seconds": 30, "moves": 4}'),
+            ("s2", "g2", '{"elapsed_seconds": 10.5, "moves": 9}'),
+            ("s3", "g3", '{"moves": 1}'),
+        ],
     )
+    conn.commit()
+    conn.close()
+
+    repo = open_sqlite()
+    top = repo.top_scores(maze_id="maze-3x3-v1")
+    assert [s["game_id"] for s in top] == ["g2", "g1", "g3"]
+
+
+def test_scores_table_without_metrics_is_recreated(open_sqlite, path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE scores (id VARCHAR PRIMARY KEY, player_id VARCHAR, score INTEGER)")
+    conn.execute("INSERT INTO scores VALUES ('s1', 'p1', 7)")
+    conn.commit()
+    conn.close()
+
+    repo = open_sqlite()
+    assert repo.top_scores(maze_id="maze-3x3-v1") == []
     repo.record_score(
-        player_id=player["id"],
-        game_id=game["id"],
-        maze_id="maze-5x5-v1",
-        maze_version="1.0",
-        metrics={"elapsed_seconds": 9, "moves": 10},
+        player_id="p1", game_id="g1", maze_id="maze-3x3-v1", maze_version="1.0",
+        metrics={"elapsed_seconds": 5, "moves": 3},
     )
+    assert [s["game_id"] for s in repo.top_scores(maze_id="maze-3x3-v1")] == ["g1"]
 
-    top = repo.top_scores(maze_id="maze-5x5-v1", limit=2)
-    assert len(top) == 2
-    assert (top[0]["metrics"]["elapsed_seconds"], top[0]["metrics"]["moves"]) == (9, 10)
 
-    if hasattr(repo, "close"):
-        repo.close()
+def test_in_memory_repo_skips_wal_and_shares_one_database(open_sqlite):
+    repo = open_sqlite(":memory:")
+    with repo.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+
+    player = repo.get_or_create_player("neo")
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(repo.get_player(player["id"])))
+    worker.start()
+    worker.join()
+    assert seen == [player]
+
+
+def test_in_memory_readers_do_not_disturb_a_transaction(open_sqlite):
+    repo = open_sqlite(":memory:")
+    player = repo.get_or_create_player("neo")
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        try:
+            while not stop.is_set():
+                repo.get_player(player["id"])
+                repo.top_scores()
+        except Exception as exc:  # pragma: no cover - surfaced by the assert
+            errors.append(exc)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for t in readers:
+        t.start()
+    try:
+        games = []
+        for i in range(20):
+            with repo.transaction():
+                games.append(repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"i": i}))
+                repo.record_score(player["id"], games[-1]["id"], "maze-3x3-v1", "1.0", {"moves": i})
+    finally:
+        stop.set()
+        for t in readers:
+            t.join()
+    assert errors == []
+    assert all(repo.get_game(g["id"]) is not None for g in games)
+    assert len(repo.top_scores(limit=None)) == 20
+
+
+def test_concurrent_writers_share_the_repo(repo):
+    player = repo.get_or_create_player("neo")
+    errors = []
+
+    def play(n):
+        try:
+            for i in range(20):
+                game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"n": n, "i": i})
+                repo.save_game(game["id"], {"n": n, "i": i, "done": True}, status="completed")
+        except Exception as exc:  # pragma: no cover - surfaced by the assert
+            errors.append(exc)
+
+    threads = [threading.Thread(target=play, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def test_idle_threads_do_not_hold_pooled_connections(repo):
+    player = repo.get_or_create_player("neo")
+    # More live threads than QueuePool's 5 + 10 overflow connections.
+    n_threads = 20
+    done = threading.Semaphore(0)
+    release = threading.Event()
+    errors = []
+
+    def read_then_idle():
+        try:
+            assert repo.get_player(player["id"]) == player
+            repo.top_scores()
+        except Exception as exc:  # pragma: no cover - surfaced by the assert
+            errors.append(exc)
+        done.release()
+        release.wait()
+
+    threads = [threading.Thread(target=read_then_idle) for _ in range(n_threads)]
+    for t in threads:
+        t.start()
+    try:
+        for i in range(n_threads):
+            assert done.acquire(timeout=10), f"thread {i} hung waiting for a connection"
+    finally:
+        release.set()
+        for t in threads:
+            t.join()
+    assert errors == []
+    assert repo.engine.pool.checkedout() == 0
+
+
+def test_deferred_save_game_is_visible_and_committed_on_flush(open_sqlite):
+    repo = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+
+    repo.save_game(game["id"], {"move_count": 1}, flush=False)
+    repo.save_game(game["id"], {"move_count": 2}, flush=False)
+    assert repo.get_game(game["id"])["state"] == {"move_count": 2}
+
+    other = open_sqlite()
+    assert other.get_game(game["id"])["state"] == {"move_count": 0}
+
+    repo.flush()
+    assert other.get_game(game["id"])["state"] == {"move_count": 2}
+
+    repo.save_game(game["id"], {"move_count": 3}, status="completed", flush=False)
+    repo.close()
+    reloaded = other.get_game(game["id"])
+    assert reloaded["state"] == {"move_count": 3}
+    assert reloaded["status"] == "completed"
+
+
+def test_batch_defers_saves_until_the_outermost_block_exits(open_sqlite):
+    repo = open_sqlite()
+    other = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+
+    with repo.batch():
+        repo.save_game(game["id"], {"move_count": 1})
+        with repo.batch():
+            repo.save_game(game["id"], {"move_count": 2})
+        assert repo.get_game(game["id"])["state"] == {"move_count": 2}
+        assert other.get_game(game["id"])["state"] == {"move_count": 0}
+    assert other.get_game(game["id"])["state"] == {"move_count": 2}
+
+    repo.save_game(game["id"], {"move_count": 3})
+    assert other.get_game(game["id"])["state"] == {"move_count": 3}
+
+
+def test_batch_is_not_committed_or_seen_by_other_threads(open_sqlite):
+    repo = open_sqlite()
+    other = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    mine = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+    theirs = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+    seen = {}
+
+    def other_thread():
+        seen["mine"] = repo.get_game(mine["id"])["state"]
+        repo.save_game(theirs["id"], {"move_count": 5})
+        repo.flush()
+
+    with repo.batch():
+        repo.save_game(mine["id"], {"move_count": 1})
+        worker = threading.Thread(target=other_thread)
+        worker.start()
+        worker.join()
+        assert seen["mine"] == {"move_count": 0}
+        assert other.get_game(mine["id"])["state"] == {"move_count": 0}
+        assert other.get_game(theirs["id"])["state"] == {"move_count": 5}
+    assert other.get_game(mine["id"])["state"] == {"move_count": 1}
+
+
+def test_transaction_commits_once_or_rolls_back(open_sqlite, path):
+    repo = open_sqlite()
+    other = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+
+    def top_in_other_thread():
+        # The same repo, so its top_scores cache is what answers.
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(len(repo.top_scores("maze-3x3-v1"))))
+        worker.start()
+        worker.join()
+        return seen[0]
+
+    with repo.transaction():
+        # BEGIN IMMEDIATE: the database write lock is held before any write.
+        locked = sqlite3.connect(path, timeout=0)
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            locked.execute("BEGIN IMMEDIATE")
+        locked.close()
+        repo.record_score(player["id"], game["id"], "maze-3x3-v1", "1.0", {"elapsed_seconds": 5, "moves": 7})
+        with repo.transaction():
+            repo.save_game(game["id"], {"move_count": 7}, status="completed")
+        assert len(repo.top_scores("maze-3x3-v1")) == 1
+        assert top_in_other_thread() == 0
+        assert other.get_game(game["id"])["status"] == "in_progress"
+    assert other.get_game(game["id"])["status"] == "completed"
+    assert top_in_other_thread() == 1
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.record_score(player["id"], game["id"], "maze-3x3-v1", "1.0", {"elapsed_seconds": 1, "moves": 1})
+            assert len(repo.top_scores("maze-3x3-v1")) == 2
+            raise RuntimeError("abort")
+    assert top_in_other_thread() == 1
+    assert len(repo.top_scores("maze-3x3-v1")) == 1
+
+
+def test_transaction_rollback_discards_deferred_saves(open_sqlite):
+    repo = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+    repo.save_game(game["id"], {"move_count": 1}, flush=False)
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.save_game(game["id"], {"move_count": 99}, flush=False)
+            with repo.batch():
+                repo.save_game(game["id"], {"move_count": 98})
+            raise RuntimeError("abort")
+    # The save deferred before the block is still pending; the block's are gone.
+    assert repo.get_game(game["id"])["state"] == {"move_count": 1}
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.flush()
+            raise RuntimeError("abort")
+    assert repo.get_game(game["id"])["state"] == {"move_count": 1}
+
+    repo.close()
+    reopened = open_sqlite()
+    assert reopened.get_game(game["id"])["state"] == {"move_count": 1}
+
+
+def test_close_checkpoints_and_truncates_wal(open_sqlite, path):
+    repo = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+    wal = path.with_name(path.name + "-wal")
+    assert wal.exists() and wal.stat().st_size > 0
+
+    repo.close()
+    assert not wal.exists() or wal.stat().st_size == 0
+
+
+def test_compact_vacuums_free_pages_and_keeps_data(repo):
+    player = repo.get_or_create_player("neo")
+    game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"log": "x" * 200_000})
+    # Shrinking the state frees its overflow pages.
+    repo.save_game(game["id"], {"move_count": 1})
+
+    def free_pages():
+        with repo.engine.connect() as conn:
+            return conn.execute(text("PRAGMA freelist_count")).scalar_one()
+
+    assert free_pages() > 0
+    repo.save_game(game["id"], {"move_count": 2}, flush=False)
+    repo.compact()
+    assert free_pages() == 0
+    assert repo.get_game(game["id"])["state"] == {"move_count": 2}
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.compact()
+
+
+def test_unclosed_repo_releases_its_connections_when_collected(db_module, path):
+    # Opened directly, not via open_sqlite: nothing else may hold a reference.
+    repo = db_module.SqliteGameRepository(path)
+    repo.get_or_create_player("neo")
+    engine = repo.engine
+    assert engine.pool.checkedin() > 0
+
+    del repo
+    gc.collect()
+    assert engine.pool.checkedin() == 0
+
+
+def test_unclosed_repo_commits_deferred_saves_when_collected(db_module, open_sqlite, path):
+    repo = db_module.SqliteGameRepository(path)
+    player = repo.get_or_create_player("neo")
+    game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+    repo.save_game(game["id"], {"move_count": 4}, flush=False)
+
+    with pytest.warns(ResourceWarning, match="without close"):
+        del repo
+        gc.collect()
+    assert open_sqlite().get_game(game["id"])["state"] == {"move_count": 4}
+
+
+def test_deferred_saves_of_an_exited_thread_are_not_inherited(open_sqlite):
+    repo = open_sqlite()
+    other = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    games = [repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0}) for _ in range(2)]
+
+    def defer(game, state):
+        repo.save_game(game["id"], state, flush=False)
+
+    # Thread idents are often reused once a thread exits; the saves must not be.
+    first = threading.Thread(target=defer, args=(games[0], {"move_count": 1}))
+    first.start()
+    first.join()
+    seen = []
+
+    def read_and_flush():
+        seen.append(repo.get_game(games[0]["id"])["state"])
+        repo.save_game(games[1]["id"], {"move_count": 2})
+
+    second = threading.Thread(target=read_and_flush)
+    second.start()
+    second.join()
+    assert seen == [{"move_count": 0}]
+    assert other.get_game(games[0]["id"])["state"] == {"move_count": 0}
+
+    repo.close()
+    assert other.get_game(games[0]["id"])["state"] == {"move_count": 1}
+
+
+def test_incompatible_games_table_is_recreated(open_sqlite, path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE games (id VARCHAR PRIMARY KEY, state_json VARCHAR)")
+    conn.commit()
+    conn.close()
+
+    repo = open_sqlite()
+    player = repo.get_or_create_player("neo")
+    game = repo.create_game(player["id"], "maze-3x3-v1", "1.0", {"move_count": 0})
+    assert repo.get_game(game["id"])["state"] == {"move_count": 0}